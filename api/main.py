@@ -14,28 +14,35 @@
 """
 
 from fastapi import FastAPI, HTTPException, Depends, status, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
+import asyncio
+import hashlib
 import logging
+import queue
+import re
+import threading
 import time
 import os
 import sys
 from pathlib import Path
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 
 # Prometheus metrics
 from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
+from starlette.concurrency import run_in_threadpool
 from starlette.responses import Response
 
-# Rate limiting
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
+from starlette.routing import compile_path
 
 # JWT authentication
 import jwt
@@ -66,6 +73,9 @@ class Settings:
     SECRET_KEY = os.getenv("SECRET_KEY", "CHANGE_ME_IN_PRODUCTION")
     JWT_ALGORITHM = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
+    TOKEN_CACHE_TTL_SECONDS = float(os.getenv("TOKEN_CACHE_TTL_SECONDS", "15"))
+    TOKEN_CACHE_MAX_SIZE = int(os.getenv("TOKEN_CACHE_MAX_SIZE", "10000"))
+    CRYPTO_WORKERS = int(os.getenv("CRYPTO_WORKERS", "2"))
     
     # CORS
     CORS_ORIGINS = os.getenv("CORS_ORIGINS", "*").split(",")
@@ -74,10 +84,19 @@ class Settings:
     RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
     RATE_LIMIT_DEFAULT = os.getenv("RATE_LIMIT_DEFAULT", "100/minute")
     
+    # Requests
+    MAX_BODY_SIZE = int(os.getenv("MAX_BODY_SIZE", str(10 * 1024 * 1024)))  # bytes
+    
     # Server
     HOST = os.getenv("HOST", "0.0.0.0")
     PORT = int(os.getenv("PORT", "8080"))
     WORKERS = int(os.getenv("WORKERS", "4"))
+    # uvloop is not available on Windows; fall back to the asyncio loop there
+    LOOP = os.getenv("UVICORN_LOOP", "asyncio" if sys.platform == "win32" else "uvloop")
+    HTTP = os.getenv("UVICORN_HTTP", "httptools")
+    
+    # Metrics
+    METRICS_CACHE_TTL_SECONDS = float(os.getenv("METRICS_CACHE_TTL_SECONDS", "1.0"))
     
     # Logging
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
@@ -88,13 +107,34 @@ class Settings:
 # Logging Setup
 # ============================================================================
 
+class BatchingFileHandler(logging.FileHandler):
+    """FileHandler that coalesces bursts of queued records into a single write.
+    
+    While more records are waiting in the log queue the flush is skipped, so they
+    share the stream buffer; it flushes as soon as the queue drains, so logs are
+    never held back when traffic is light.
+    """
+    
+    def __init__(self, filename, pending: queue.Queue, **kwargs):
+        self.pending = pending
+        super().__init__(filename, **kwargs)
+    
+    def flush(self):
+        if not self.pending.empty():
+            return
+        super().flush()
+
+# Request handlers only enqueue records; a background listener thread owns the
+# blocking stream/file handlers so disk writes never stall the event loop.
+# Records are formatted by the QueueHandler, so the sinks need no formatter.
+log_queue: queue.Queue = queue.Queue(-1)
+file_handler = BatchingFileHandler('api.log', log_queue)
+log_listener = QueueListener(log_queue, logging.StreamHandler(), file_handler)
+
 logging.basicConfig(
     level=getattr(logging, settings.LOG_LEVEL),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('api.log')
-    ]
+    handlers=[QueueHandler(log_queue)]
 )
 logger = logging.getLogger(__name__)
 
@@ -137,6 +177,29 @@ class Settings:
     ['collection']
 )
 
+# Pre-bound label children: .labels() hashes and validates the label values on
+# every call, so resolve each child once and reuse it. Only labels from a fixed set
+# are cached; db_operations is labelled with the client-supplied collection name,
+# so it calls .labels() directly rather than growing a cache per name.
+_request_count_children: Dict[tuple, Any] = {}
+_request_duration_children: Dict[tuple, Any] = {}
+
+_db_operation_duration_children = {
+    operation: db_operation_duration.labels(operation=operation)
+    for operation in ("create_collection", "add_document", "add_batch", "search")
+}
+
+# Request methods recorded as-is; anything else is labelled "OTHER" so clients
+# can't mint label values
+_METRIC_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"})
+
+def _metric_child(metric, children: Dict[tuple, Any], *label_values):
+    """Return the cached child of a labelled metric, creating it on first use"""
+    child = children.get(label_values)
+    if child is None:
+        child = children[label_values] = metric.labels(*label_values)
+    return child
+
 # ============================================================================
 # Database Manager
 # ============================================================================
@@ -196,55 +259,154 @@ def get_db(self) -> pyvdb.VectorDatabase:
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security = HTTPBearer()
 
+# Reusable decoder with options fixed once instead of merged on every call
+_jwt_decoder = jwt.PyJWT(options={
+    "verify_signature": True,
+    "verify_exp": True,
+    "require": ["exp", "sub"]
+})
+_JWT_ALGORITHMS = [settings.JWT_ALGORITHM]
+_SECRET_BYTES = settings.SECRET_KEY.encode()
+
+# Pre-generated bcrypt hash of the demo password "admin123" (CHANGE IN PRODUCTION).
+# Hashing at import time would cost a full bcrypt round on every worker start.
+DEFAULT_ADMIN_PASSWORD_HASH = "$2b$12$2vIU77rcw7F/asVqKlEms.3sERQ46vAVzd0LR14hPgz5gV8bPPmfi"
+
 # Simple in-memory user store (replace with database in production)
 USERS_DB = {
     "admin": {
         "username": "admin",
-        "hashed_password": pwd_context.hash("admin123"),  # CHANGE IN PRODUCTION
+        "hashed_password": os.getenv("ADMIN_PW_HASH", DEFAULT_ADMIN_PASSWORD_HASH),
         "role": "admin"
     }
 }
 
+# Successful password checks: username -> (keyed digest of password + hash, monotonic expiry).
+# The digest key is random per process so cached entries are useless outside it.
+_password_cache: Dict[str, tuple] = {}
+_password_cache_lock = threading.Lock()
+_PASSWORD_CACHE_KEY = os.urandom(32)
+
+async def verify_password(
+    executor: ThreadPoolExecutor,
+    username: str,
+    plain_password: str,
+    hashed_password: str
+) -> bool:
+    """Verify a password on executor, caching successful checks for the token lifetime"""
+    digest = hashlib.blake2b(
+        f"{hashed_password}\0{plain_password}".encode(),
+        key=_PASSWORD_CACHE_KEY,
+        digest_size=32
+    ).digest()
+    
+    with _password_cache_lock:
+        entry = _password_cache.get(username)
+        if entry is not None and entry[0] == digest and entry[1] > time.monotonic():
+            return True
+    
+    loop = asyncio.get_running_loop()
+    if not await loop.run_in_executor(
+        executor, pwd_context.verify, plain_password, hashed_password
+    ):
+        return False
+    
+    with _password_cache_lock:
+        _password_cache[username] = (
+            digest,
+            time.monotonic() + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        )
+    return True
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create JWT access token"""
     to_encode = data.copy()
-    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=15))
+    expire = int(time.time()) + int((expires_delta or timedelta(minutes=15)).total_seconds())
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
     return encoded_jwt
 
+# Verified tokens: blake2b(token) -> (username, monotonic expiry)
+_token_cache: Dict[bytes, tuple] = {}
+_token_cache_lock = threading.Lock()
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+def _get_cached_token(key: bytes) -> Optional[str]:
+    """Return the cached username for a verified token, if still fresh"""
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+        if entry is None:
+            return None
+        username, expires_at = entry
+        if expires_at <= time.monotonic():
+            del _token_cache[key]
+            return None
+        return username
+
+def _cache_token(key: bytes, username: str, exp: float):
+    """Cache a successfully verified token, never past its own expiry"""
+    ttl = min(settings.TOKEN_CACHE_TTL_SECONDS, exp - time.time())
+    if ttl <= 0:
+        return
+    now = time.monotonic()
+    with _token_cache_lock:
+        if len(_token_cache) >= settings.TOKEN_CACHE_MAX_SIZE:
+            for k in [k for k, (_, expires_at) in _token_cache.items() if expires_at <= now]:
+                del _token_cache[k]
+            if len(_token_cache) >= settings.TOKEN_CACHE_MAX_SIZE:
+                # Still full: drop the oldest entry (dicts keep insertion order)
+                del _token_cache[next(iter(_token_cache))]
+        _token_cache[key] = (username, now + ttl)
+
 def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Verify JWT token"""
+    token = credentials.credentials
+    key = _token_cache_key(token)
+    username = _get_cached_token(key)
+    if username is not None:
+        return username
+    
     try:
-        token = credentials.credentials
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
-        username: str = payload.get("sub")
+        payload = _jwt_decoder.decode(token, _SECRET_BYTES, algorithms=_JWT_ALGORITHMS)
+        username = payload.get("sub")
         if username is None:
             raise HTTPException(status_code=401, detail="Invalid authentication credentials")
-        return username
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token has expired")
-    except jwt.JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Could not validate credentials")
+    
+    # Only successful validations with an expiry are cached
+    exp = payload.get("exp")
+    if exp is not None:
+        _cache_token(key, username, exp)
+    return username
 
 # ============================================================================
 # Pydantic Models
 # ============================================================================
 
+class RequestModel(BaseModel):
+    """Base for request bodies: immutable once validated, with bounded strings"""
+    model_config = ConfigDict(frozen=True, str_max_length=1_000_000)
+
 class Token(BaseModel):
     access_token: str
     token_type: str
 
-class LoginRequest(BaseModel):
+class LoginRequest(RequestModel):
     username: str
     password: str
 
-class CollectionCreate(BaseModel):
+class CollectionCreate(RequestModel):
     name: str = Field(..., min_length=1, max_length=100)
     dimension: int = Field(default=1536, ge=1, le=4096)
     metric: str = Field(default="cosine")
     
-    @validator('metric')
+    @field_validator('metric')
+    @classmethod
     def validate_metric(cls, v):
         allowed = ['cosine', 'euclidean', 'dot_product']
         if v not in allowed:
@@ -258,15 +420,15 @@ class CollectionInfo(BaseModel):
     document_count: int
     created_at: Optional[str] = None
 
-class DocumentAdd(BaseModel):
+class DocumentAdd(RequestModel):
     content: str = Field(..., min_length=1)
     metadata: Dict[str, Any] = Field(default_factory=dict)
     document_type: Optional[str] = "general"
 
-class DocumentBatchAdd(BaseModel):
+class DocumentBatchAdd(RequestModel):
     documents: List[DocumentAdd]
 
-class SearchRequest(BaseModel):
+class SearchRequest(RequestModel):
     query: str = Field(..., min_length=1)
     k: int = Field(default=10, ge=1, le=100)
     filters: Optional[Dict[str, Any]] = None
@@ -293,19 +455,180 @@ class StatsResponse(BaseModel):
 # Rate Limiting
 # ============================================================================
 
-limiter = Limiter(key_func=get_remote_address)
+# Per-endpoint limits, keyed by (method, route path template) so each endpoint gets
+# its own bucket even when it shares a path with another. Endpoints not listed are not limited.
+RATE_LIMITS = {
+    ("POST", "/auth/login"): "5/minute",
+    ("POST", "/collections"): settings.RATE_LIMIT_DEFAULT,
+    ("GET", "/collections"): settings.RATE_LIMIT_DEFAULT,
+    ("DELETE", "/collections/{collection_name}"): settings.RATE_LIMIT_DEFAULT,
+    ("POST", "/collections/{collection_name}/documents"): settings.RATE_LIMIT_DEFAULT,
+    ("POST", "/collections/{collection_name}/documents/batch"): "10/minute",
+    ("POST", "/collections/{collection_name}/search"): settings.RATE_LIMIT_DEFAULT,
+}
+
+# Period lengths in seconds, as in the `limits` grammar slowapi used to parse
+_RATE_PERIODS = {
+    "second": 1,
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+    "month": 30 * 86400,
+    "year": 12 * 30 * 86400,
+}
+
+# "<count> / [multiple] <period>" or "<count> per [multiple] <period>", e.g.
+# "100/minute", "100 per minute", "10/5 minutes"
+_RATE_RE = re.compile(
+    r"^\s*(\d+)\s*(?:/|\s+per\s+)\s*(\d+)?\s*(second|minute|hour|day|month|year)s?\s*$",
+    re.IGNORECASE
+)
+
+def parse_rate(rate: str) -> tuple:
+    """Parse a limit such as "100/minute" into (tokens per second, burst size)"""
+    match = _RATE_RE.match(rate)
+    if match is None:
+        raise ValueError(
+            f"Invalid rate limit {rate!r}: expected '<count>/<period>' or "
+            f"'<count> per <period>', optionally with a multiple such as '10/5 minutes' "
+            f"(periods: {', '.join(_RATE_PERIODS)})"
+        )
+    count, multiple, period = match.groups()
+    burst = float(count)
+    if burst <= 0:
+        raise ValueError(f"Invalid rate limit {rate!r}: count must be at least 1")
+    seconds = int(multiple or 1) * _RATE_PERIODS[period.lower()]
+    if seconds <= 0:
+        raise ValueError(f"Invalid rate limit {rate!r}: period multiple must be at least 1")
+    return burst / seconds, burst
+
+class RateLimitMiddleware:
+    """Per-client token-bucket rate limiting (pure ASGI)"""
+    
+    MAX_BUCKETS = 100_000
+    # Seconds between sweeps for buckets that have refilled completely
+    PRUNE_INTERVAL = 60.0
+    
+    def __init__(self, app, limits: Dict[tuple, str]):
+        self.app = app
+        # (method, route template) -> (limit string, tokens per second, burst size)
+        self.limits = {endpoint: (rate, *parse_rate(rate)) for endpoint, rate in limits.items()}
+        self.routes = [(method, compile_path(path)[0], (method, path)) for method, path in limits]
+        # (client ip, method, route template) -> [tokens, last refill time]
+        # Least recently used first: each hit moves its bucket to the end
+        self.buckets: "OrderedDict[tuple, list]" = OrderedDict()
+        self.next_prune = time.monotonic() + self.PRUNE_INTERVAL
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        method, path = scope["method"], scope["path"]
+        endpoint = next(
+            (e for m, regex, e in self.routes if m == method and regex.match(path)), None
+        )
+        if endpoint is None:
+            await self.app(scope, receive, send)
+            return
+        
+        rate, refill_per_second, burst = self.limits[endpoint]
+        client = scope.get("client")
+        key = (client[0] if client else "unknown", *endpoint)
+        now = time.monotonic()
+        
+        if now >= self.next_prune:
+            self.next_prune = now + self.PRUNE_INTERVAL
+            self._prune(now)
+        
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            # Hard cap: evict the least recently used buckets, so a flood of new
+            # clients costs O(1) per request and can't grow memory
+            while len(self.buckets) >= self.MAX_BUCKETS:
+                self.buckets.popitem(last=False)
+            bucket = self.buckets[key] = [burst, now]
+        else:
+            self.buckets.move_to_end(key)
+            bucket[0] = min(burst, bucket[0] + (now - bucket[1]) * refill_per_second)
+            bucket[1] = now
+        
+        if bucket[0] < 1.0:
+            retry_after = (1.0 - bucket[0]) / refill_per_second
+            response = JSONResponse(
+                status_code=429,
+                content={"detail": f"Rate limit exceeded: {rate}"},
+                headers={"Retry-After": str(int(retry_after) + 1)}
+            )
+            await response(scope, receive, send)
+            return
+        
+        bucket[0] -= 1.0
+        await self.app(scope, receive, send)
+    
+    def _prune(self, now: float):
+        """Drop buckets that have been idle long enough to refill completely"""
+        for key, (tokens, last) in list(self.buckets.items()):
+            _, refill_per_second, burst = self.limits[key[1:]]
+            if tokens + (now - last) * refill_per_second >= burst:
+                del self.buckets[key]
+
+class MaxBodySizeMiddleware:
+    """Reject request bodies larger than MAX_BODY_SIZE before they are parsed"""
+    
+    def __init__(self, app, max_body_size: int):
+        self.app = app
+        self.max_body_size = max_body_size
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if int(value) > self.max_body_size:
+                    response = JSONResponse(
+                        status_code=413,
+                        content={"detail": "Request body too large"}
+                    )
+                    await response(scope, receive, send)
+                    return
+                break
+        
+        # Bodies without Content-Length (chunked) are counted as they stream in
+        received = 0
+        
+        async def receive_wrapper():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    raise HTTPException(status_code=413, detail="Request body too large")
+            return message
+        
+        await self.app(scope, receive_wrapper, send)
 
 # ============================================================================
 # Application Lifecycle
 # ============================================================================
 
-start_time = time.time()
+start_time = time.perf_counter()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     # Startup
+    log_listener.start()
     logger.info("Starting Vector Studio API...")
+    # bcrypt is deliberately slow; run it on a small dedicated pool so logins neither
+    # block the event loop nor starve the default threadpool. The pool belongs to
+    # this lifespan, so a restarted app gets a fresh one.
+    app.state.crypto_executor = ThreadPoolExecutor(
+        max_workers=settings.CRYPTO_WORKERS,
+        thread_name_prefix="crypto"
+    )
     db_manager.initialize()
     logger.info("API ready to accept requests")
     
@@ -319,6 +642,11 @@ async def lifespan(app: FastAPI):
             logger.info("Database synced successfully")
         except Exception as e:
             logger.error(f"Error syncing database: {e}")
+    app.state.crypto_executor.shutdown(wait=False)
+    log_listener.stop()
+    # The listener's stop sentinel made the queue look non-empty while the last
+    # records were handled, so their flush was skipped; the queue is drained now
+    file_handler.flush()
 
 # ============================================================================
 # FastAPI Application
@@ -330,12 +658,16 @@ async def lifespan(app: FastAPI):
     description="Production-ready vector database REST API",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
-# Add rate limiting
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+# Add rate limiting (innermost, so 429 responses still get CORS headers)
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(RateLimitMiddleware, limits=RATE_LIMITS)
+
+# Inside CORS as well, so 413 responses get CORS headers
+app.add_middleware(MaxBodySizeMiddleware, max_body_size=settings.MAX_BODY_SIZE)
 
 # Add CORS middleware
 app.add_middleware(
@@ -353,64 +685,100 @@ async def lifespan(app: FastAPI):
 # Middleware
 # ============================================================================
 
-@app.middleware("http")
-async def metrics_middleware(request: Request, call_next):
-    """Track request metrics"""
-    active_connections.inc()
-    start = time.time()
+class MetricsMiddleware:
+    """Track request metrics (pure ASGI, no per-request Request/Response wrapping)"""
     
-    try:
-        response = await call_next(request)
-        duration = time.time() - start
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        # Record metrics
-        request_count.labels(
-            method=request.method,
-            endpoint=request.url.path,
-            status=response.status_code
-        ).inc()
+        status_code = 500
         
-        request_duration.labels(
-            method=request.method,
-            endpoint=request.url.path
-        ).observe(duration)
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
         
-        return response
-    finally:
-        active_connections.dec()
+        active_connections.inc()
+        start = time.perf_counter()
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            # Label by the matched route template, not the raw path: raw paths (every
+            # collection name, every 404 probe) would grow the child caches and the
+            # Prometheus series without bound. The router sets scope["route"].
+            route = scope.get("route")
+            path = route.path if route is not None else "<unmatched>"
+            method = scope["method"] if scope["method"] in _METRIC_METHODS else "OTHER"
+            
+            # Record metrics
+            _metric_child(
+                request_count, _request_count_children, method, path, status_code
+            ).inc()
+            
+            _metric_child(
+                request_duration, _request_duration_children, method, path
+            ).observe(duration)
+            
+            active_connections.dec()
+
+app.add_middleware(MetricsMiddleware)
 
 # ============================================================================
 # Health & Metrics Endpoints
 # ============================================================================
 
+# Everything but the uptime is static on the healthy path, so only that is rendered per call
+_HEALTH_PREFIX = (
+    f'{{"status":"healthy","version":"{settings.VERSION}",'
+    f'"database":"healthy","uptime_seconds":'
+).encode()
+
 @app.get("/health", response_model=HealthResponse, tags=["System"])
 async def health_check():
     """Health check endpoint"""
     try:
         db = db_manager.get_db()
-        db_status = "healthy"
     except Exception as e:
         logger.error(f"Health check failed: {e}")
-        db_status = "unhealthy"
         raise HTTPException(status_code=503, detail="Database unavailable")
     
-    return {
-        "status": "healthy",
-        "version": settings.VERSION,
-        "database": db_status,
-        "uptime_seconds": time.time() - start_time
-    }
+    uptime = time.perf_counter() - start_time
+    return Response(
+        content=_HEALTH_PREFIX + f"{uptime}}}".encode(),
+        media_type="application/json"
+    )
+
+# Rendered exposition output: (monotonic render time, bytes)
+_metrics_cache: tuple = (float("-inf"), b"")
+_metrics_lock = asyncio.Lock()
 
 @app.get("/metrics", tags=["System"])
 async def metrics():
     """Prometheus metrics endpoint"""
-    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+    global _metrics_cache
+    
+    # Serve the last render while it is fresh; concurrent scrapes share one render
+    if time.monotonic() - _metrics_cache[0] > settings.METRICS_CACHE_TTL_SECONDS:
+        async with _metrics_lock:
+            now = time.monotonic()
+            if now - _metrics_cache[0] > settings.METRICS_CACHE_TTL_SECONDS:
+                _metrics_cache = (now, generate_latest())
+    
+    return Response(content=_metrics_cache[1], media_type=CONTENT_TYPE_LATEST)
 
 @app.get("/stats", response_model=StatsResponse, tags=["System"])
 async def get_stats(username: str = Depends(verify_token)):
     """Get database statistics"""
     db = db_manager.get_db()
-    stats = db.stats()
+    stats = await run_in_threadpool(db.stats)
     
     return {
         "total_vectors": stats.get('total_vectors', 0),
@@ -424,12 +792,16 @@ async def get_stats(username: str = Depends(verify_token)):
 # ============================================================================
 
 @app.post("/auth/login", response_model=Token, tags=["Authentication"])
-@limiter.limit("5/minute")
 async def login(request: Request, login_data: LoginRequest):
     """Login and get access token"""
     user = USERS_DB.get(login_data.username)
     
-    if not user or not pwd_context.verify(login_data.password, user["hashed_password"]):
+    if not user or not await verify_password(
+        request.app.state.crypto_executor,
+        login_data.username,
+        login_data.password,
+        user["hashed_password"]
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password"
@@ -448,14 +820,13 @@ async def login(request: Request, login_data: LoginRequest):
 # ============================================================================
 
 @app.post("/collections", response_model=CollectionInfo, tags=["Collections"])
-@limiter.limit(settings.RATE_LIMIT_DEFAULT)
 async def create_collection(
     request: Request,
     collection: CollectionCreate,
     username: str = Depends(verify_token)
 ):
     """Create a new collection"""
-    start = time.time()
+    start = time.perf_counter()
     
     try:
         db = db_manager.get_db()
@@ -466,21 +837,22 @@ async def create_collection(
         
         db_operations.labels(operation="create_collection", collection=collection.name).inc()
         
-        return {
+        # Returning the response directly skips validating it again against
+        # response_model (which is kept for the OpenAPI schema)
+        return ORJSONResponse({
             "name": collection.name,
             "dimension": collection.dimension,
             "metric": collection.metric,
             "document_count": 0,
             "created_at": datetime.utcnow().isoformat()
-        }
+        })
     except Exception as e:
         logger.error(f"Failed to create collection: {e}")
         raise HTTPException(status_code=500, detail=str(e))
     finally:
-        db_operation_duration.labels(operation="create_collection").observe(time.time() - start)
+        _db_operation_duration_children["create_collection"].observe(time.perf_counter() - start)
 
 @app.get("/collections", response_model=List[CollectionInfo], tags=["Collections"])
-@limiter.limit(settings.RATE_LIMIT_DEFAULT)
 async def list_collections(
     request: Request,
     username: str = Depends(verify_token)
@@ -490,7 +862,6 @@ async def list_collections(
     return []
 
 @app.delete("/collections/{collection_name}", tags=["Collections"])
-@limiter.limit(settings.RATE_LIMIT_DEFAULT)
 async def delete_collection(
     request: Request,
     collection_name: str,
@@ -513,7 +884,6 @@ async def delete_collection(
 # ============================================================================
 
 @app.post("/collections/{collection_name}/documents", tags=["Documents"])
-@limiter.limit(settings.RATE_LIMIT_DEFAULT)
 async def add_document(
     request: Request,
     collection_name: str,
@@ -521,7 +891,7 @@ async def add_document(
     username: str = Depends(verify_token)
 ):
     """Add a single document to a collection"""
-    start = time.time()
+    start = time.perf_counter()
     
     try:
         db = db_manager.get_db()
@@ -529,8 +899,9 @@ async def add_document(
         # Convert document type string to enum
         doc_type = pyvdb.DocumentType.Journal  # Default
         
-        # Add text with metadata
-        result = db.add_text(
+        # Add text with metadata (pyvdb releases the GIL, so run it off the event loop)
+        result = await run_in_threadpool(
+            db.add_text,
             document.content,
             document.metadata
         )
@@ -545,26 +916,49 @@ async def add_document(
         logger.error(f"Failed to add document: {e}")
         raise HTTPException(status_code=500, detail=str(e))
     finally:
-        db_operation_duration.labels(operation="add_document").observe(time.time() - start)
-
-@app.post("/collections/{collection_name}/documents/batch", tags=["Documents"])
-@limiter.limit("10/minute")
+        _db_operation_duration_children["add_document"].observe(time.perf_counter() - start)
+
+@app.post(
+    "/collections/{collection_name}/documents/batch",
+    tags=["Documents"],
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": DocumentBatchAdd.model_json_schema(
+                # DocumentAdd is already in components/schemas via the single-add route
+                ref_template="#/components/schemas/{model}"
+            )}},
+            "required": True
+        }
+    }
+)
 async def add_documents_batch(
     request: Request,
     collection_name: str,
-    batch: DocumentBatchAdd,
     username: str = Depends(verify_token)
 ):
     """Add multiple documents in batch"""
-    start = time.time()
+    start = time.perf_counter()
+    
+    # Validate straight from the raw bytes in one pass instead of letting FastAPI
+    # decode the JSON into Python objects and then validate them again
+    try:
+        batch = DocumentBatchAdd.model_validate_json(await request.body())
+    except ValidationError as e:
+        # Same error shape as FastAPI's own body validation: locs start at "body"
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        ) from e
     
     try:
         db = db_manager.get_db()
-        added_ids = []
         
-        for doc in batch.documents:
-            result = db.add_text(doc.content, doc.metadata)
-            added_ids.append(str(result))
+        # Single bulk call into the C++ backend instead of one add_text per document
+        results = await run_in_threadpool(
+            db.add_texts,
+            [doc.content for doc in batch.documents],
+            [doc.metadata for doc in batch.documents]
+        )
+        added_ids = [str(result) for result in results]
         
         db_operations.labels(operation="add_batch", collection=collection_name).inc()
         
@@ -577,14 +971,13 @@ async def add_documents_batch(
         logger.error(f"Failed to add batch: {e}")
         raise HTTPException(status_code=500, detail=str(e))
     finally:
-        db_operation_duration.labels(operation="add_batch").observe(time.time() - start)
+        _db_operation_duration_children["add_batch"].observe(time.perf_counter() - start)
 
 # ============================================================================
 # Search Endpoints
 # ============================================================================
 
 @app.post("/collections/{collection_name}/search", response_model=List[SearchResult], tags=["Search"])
-@limiter.limit(settings.RATE_LIMIT_DEFAULT)
 async def search(
     request: Request,
     collection_name: str,
@@ -592,32 +985,26 @@ async def search(
     username: str = Depends(verify_token)
 ):
     """Semantic search in a collection"""
-    start = time.time()
+    start = time.perf_counter()
     
     try:
         db = db_manager.get_db()
         
-        # Perform search
-        results = db.search(search_request.query, search_request.k)
+        # Perform search; results come back already in response format
+        search_results = await run_in_threadpool(
+            db.search_dicts, search_request.query, search_request.k
+        )
         
         db_operations.labels(operation="search", collection=collection_name).inc()
         
-        # Convert results to response format
-        search_results = []
-        for r in results:
-            search_results.append({
-                "id": str(r.id),
-                "score": float(r.score),
-                "content": getattr(r, 'content', None),
-                "metadata": r.metadata.__dict__ if hasattr(r.metadata, '__dict__') else {}
-            })
-        
-        return search_results
+        # Returning the response directly skips re-validating every result against
+        # response_model (which is kept for the OpenAPI schema)
+        return ORJSONResponse(search_results)
     except Exception as e:
         logger.error(f"Search failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
     finally:
-        db_operation_duration.labels(operation="search").observe(time.time() - start)
+        _db_operation_duration_children["search"].observe(time.perf_counter() - start)
 
 # ============================================================================
 # Main Entry Point
@@ -631,6 +1018,8 @@ async def search(
         host=settings.HOST,
         port=settings.PORT,
         workers=settings.WORKERS,
+        loop=settings.LOOP,
+        http=settings.HTTP,
         log_level=settings.LOG_LEVEL.lower(),
         reload=settings.DEBUG
     )
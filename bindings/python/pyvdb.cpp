@@ -56,6 +56,98 @@ py::array_t<float> vector_to_numpy(const Vector &vec)
     return result;
 }
 
+// ============================================================================
+// Helper: Convert Metadata to a plain dict (JSON-friendly)
+// ============================================================================
+
+py::dict metadata_to_dict(const Metadata &meta)
+{
+    py::dict d;
+    d["id"] = meta.id;
+    d["type"] = std::string(document_type_name(meta.type));
+    d["date"] = meta.date;
+    d["source_file"] = meta.source_file;
+    d["asset"] = meta.asset;
+    d["bias"] = meta.bias;
+    d["gold_price"] = meta.gold_price;
+    d["silver_price"] = meta.silver_price;
+    d["gsr"] = meta.gsr;
+    d["dxy"] = meta.dxy;
+    d["vix"] = meta.vix;
+    d["yield_10y"] = meta.yield_10y;
+    return d;
+}
+
+// ============================================================================
+// Helper: Convert a plain dict to Metadata (inverse of metadata_to_dict)
+// ============================================================================
+
+Metadata dict_to_metadata(const py::dict &d)
+{
+    Metadata meta;
+    py::dict extra;
+    for (auto item : d)
+    {
+        const auto key = py::cast<std::string>(item.first);
+        py::handle value = item.second;
+        if (key == "type")
+        {
+            if (py::isinstance<DocumentType>(value))
+            {
+                meta.type = value.cast<DocumentType>();
+                continue;
+            }
+            const auto name = py::cast<std::string>(value);
+            for (auto t = static_cast<uint8_t>(DocumentType::Journal);
+                 t < static_cast<uint8_t>(DocumentType::Unknown); ++t)
+            {
+                if (document_type_name(static_cast<DocumentType>(t)) == name)
+                {
+                    meta.type = static_cast<DocumentType>(t);
+                    break;
+                }
+            }
+        }
+        else if (key == "date")
+            meta.date = py::cast<std::string>(value);
+        else if (key == "source_file")
+            meta.source_file = py::cast<std::string>(value);
+        else if (key == "asset")
+            meta.asset = py::cast<std::string>(value);
+        else if (key == "bias")
+            meta.bias = py::cast<std::string>(value);
+        else if (key == "gold_price")
+            meta.gold_price = py::cast<std::optional<float>>(value);
+        else if (key == "silver_price")
+            meta.silver_price = py::cast<std::optional<float>>(value);
+        else if (key == "gsr")
+            meta.gsr = py::cast<std::optional<float>>(value);
+        else if (key == "dxy")
+            meta.dxy = py::cast<std::optional<float>>(value);
+        else if (key == "vix")
+            meta.vix = py::cast<std::optional<float>>(value);
+        else if (key == "yield_10y")
+            meta.yield_10y = py::cast<std::optional<float>>(value);
+        else if (key != "id")  // ids are assigned by the database
+            extra[item.first] = value;
+    }
+    if (!extra.empty())
+    {
+        meta.extra_json = py::cast<std::string>(py::module_::import("json").attr("dumps")(extra));
+    }
+    return meta;
+}
+
+py::dict query_result_to_dict(const QueryResult &r)
+{
+    py::dict d;
+    d["id"] = std::to_string(r.id);
+    d["score"] = r.score;
+    d["content"] = py::none();
+    d["metadata"] = r.metadata ? metadata_to_dict(*r.metadata) : py::dict();
+    return d;
+}
+
 // ============================================================================
 // Module Definition
 // ============================================================================
@@ -121,6 +213,7 @@ PYBIND11_MODULE(pyvdb, m)
         .def_readwrite("dxy", &Metadata::dxy)
         .def_readwrite("vix", &Metadata::vix)
         .def_readwrite("yield_10y", &Metadata::yield_10y)
+        .def("to_dict", &metadata_to_dict)
         .def("__repr__", [](const Metadata &m)
              { return "<Metadata id=" + std::to_string(m.id) +
                       " type=" + std::string(document_type_name(m.type)) +
@@ -148,6 +241,7 @@ PYBIND11_MODULE(pyvdb, m)
         .def_readonly("distance", &QueryResult::distance)
         .def_readonly("score", &QueryResult::score)
         .def_readonly("metadata", &QueryResult::metadata)
+        .def("to_dict", &query_result_to_dict)
         .def("__repr__", [](const QueryResult &r)
              { return "<QueryResult id=" + std::to_string(r.id) +
                       " score=" + std::to_string(r.score) + ">"; });
@@ -209,7 +303,8 @@ PYBIND11_MODULE(pyvdb, m)
             if (!result) {
                 throw std::runtime_error(result.error().message);
             }
-            return *result; }, py::arg("text"), py::arg("metadata"))
+            return *result; }, py::arg("text"), py::arg("metadata"),
+             py::call_guard<py::gil_scoped_release>())
 
         .def("add_text", [](VectorDatabase &self, const std::string &text, DocumentType type, const std::string &date)
              {
@@ -217,7 +312,27 @@ PYBIND11_MODULE(pyvdb, m)
             if (!result) {
                 throw std::runtime_error(result.error().message);
             }
-            return *result; }, py::arg("text"), py::arg("type"), py::arg("date"))
+            return *result; }, py::arg("text"), py::arg("type"), py::arg("date"),
+             py::call_guard<py::gil_scoped_release>())
+
+        // Metadata arrives as plain dicts; they are converted while the GIL is held,
+        // then released for the C++ batch insert
+        .def("add_texts", [](VectorDatabase &self, const std::vector<std::string> &texts, const std::vector<py::dict> &metadata)
+             {
+            std::vector<Metadata> meta;
+            meta.reserve(metadata.size());
+            for (const auto &d : metadata) {
+                meta.push_back(dict_to_metadata(d));
+            }
+            auto result = [&]
+            {
+                py::gil_scoped_release release;
+                return self.add_texts(texts, meta);
+            }();
+            if (!result) {
+                throw std::runtime_error(result.error().message);
+            }
+            return *result; }, py::arg("texts"), py::arg("metadata"))
 
         .def("query_text", [](VectorDatabase &self, const std::string &query, const QueryOptions &options)
              {
@@ -225,7 +340,8 @@ PYBIND11_MODULE(pyvdb, m)
             if (!result) {
                 throw std::runtime_error(result.error().message);
             }
-            return *result; }, py::arg("query"), py::arg("options") = QueryOptions())
+            return *result; }, py::arg("query"), py::arg("options") = QueryOptions(),
+             py::call_guard<py::gil_scoped_release>())
 
         // Simple query interface
         .def("search", [](VectorDatabase &self, const std::string &query, size_t k)
@@ -236,7 +352,27 @@ PYBIND11_MODULE(pyvdb, m)
             if (!result) {
                 throw std::runtime_error(result.error().message);
             }
-            return *result; }, py::arg("query"), py::arg("k") = 10)
+            return *result; }, py::arg("query"), py::arg("k") = 10,
+             py::call_guard<py::gil_scoped_release>())
+
+        // Search returning plain dicts (no QueryResult objects cross into Python)
+        .def("search_dicts", [](VectorDatabase &self, const std::string &query, size_t k)
+             {
+            QueryOptions opts;
+            opts.k = k;
+            auto result = [&]
+            {
+                py::gil_scoped_release release;
+                return self.query_text(query, opts);
+            }();
+            if (!result) {
+                throw std::runtime_error(result.error().message);
+            }
+            py::list out;
+            for (const auto &r : *result) {
+                out.append(query_result_to_dict(r));
+            }
+            return out; }, py::arg("query"), py::arg("k") = 10)
 
         // Image operations
         .def("add_image", [](VectorDatabase &self, const std::string &path, const Metadata &meta)
@@ -315,14 +451,14 @@ PYBIND11_MODULE(pyvdb, m)
         .def("size", &VectorDatabase::size)
         .def("count_by_type", &VectorDatabase::count_by_type, py::arg("type"))
         .def("all_dates", &VectorDatabase::all_dates)
-        .def("stats", &VectorDatabase::stats)
+        .def("stats", &VectorDatabase::stats, py::call_guard<py::gil_scoped_release>())
         .def("optimize", &VectorDatabase::optimize)
         .def("sync", [](VectorDatabase &self)
              {
             auto result = self.sync();
             if (!result) {
                 throw std::runtime_error(result.error().message);
-            } })
+            } }, py::call_guard<py::gil_scoped_release>())
         .def("compact", [](VectorDatabase &self)
              {
             auto result = self.compact();
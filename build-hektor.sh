@@ -638,7 +638,7 @@ install_python_dependencies() {
     if [ "$INSTALL_DEV" = true ]; then
         log_substep "Installing development dependencies..."
         pip install --quiet \
-            pytest pytest-cov pytest-benchmark pytest-asyncio \
+            pytest pytest-cov pytest-benchmark pytest-asyncio pytest-xdist \
             black ruff mypy \
             mkdocs mkdocs-material 2>&1 | tee -a "$LOG_FILE" &
         spinner $! "Dev tools (pytest, black, ruff, mypy...)"
@@ -6,51 +6,90 @@
 Models:
 - Text: sentence-transformers/all-MiniLM-L6-v2 (384-dim → projected to 512)
 - Image: laion/CLIP-ViT-B-32-laion2B-s34B-b79K (512-dim native, open-source CLIP alternative)
+  The optional fp16/int8 image variants are exports of OpenAI's CLIP ViT-B/32 weights,
+  a different embedding space from the LAION model.
 """
 
 import argparse
-import hashlib
+import importlib.util
 import os
+import re
 import sys
+import threading
+import time
 from pathlib import Path
 from typing import Optional
 
-try:
-    from huggingface_hub import hf_hub_download, snapshot_download
-    from transformers import AutoTokenizer
-    HAS_HF = True
-except ImportError:
-    HAS_HF = False
+# Let huggingface_hub use the multi-connection Rust downloader when it is installed.
+# Must be set before huggingface_hub is imported; it errors if enabled but missing.
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+# huggingface_hub is imported where it's used, so --status doesn't pay for it
+HAS_HF = importlib.util.find_spec("huggingface_hub") is not None
+
+# Concurrent file downloads per snapshot_download call
+HF_MAX_WORKERS = 8
 
 # Model configurations
 MODELS = {
     "text": {
         "repo_id": "sentence-transformers/all-MiniLM-L6-v2",
-        "onnx_file": "model.onnx",
+        "onnx_file": "model_quantized.onnx",    # int8 weights (default)
+        "fp32_onnx_file": "model.onnx",         # Full precision, via --fp32
         "vocab_file": "vocab.txt",
         "dimension": 384,
-        "description": "Semantic text embeddings (MiniLM-L6-v2)"
+        "description": "Semantic text embeddings (MiniLM-L6-v2)",
     },
     "image": {
         "repo_id": "laion/CLIP-ViT-B-32-laion2B-s34B-b79K",
         "onnx_file": "visual_model.onnx",
         "dimension": 512,
-        "description": "CLIP ViT-B/32 visual encoder (LAION open-source)"
+        "description": "CLIP ViT-B/32 visual encoder (LAION open-source)",
+        # Precision-tagged filenames so several variants can coexist on disk
+        "precision_files": {
+            "fp32": "visual.onnx",
+            "fp16": "visual_fp16.onnx",
+            "int8": "visual_int8.onnx",
+        },
     }
 }
 
 # Alternative ONNX model sources (if HuggingFace doesn't have ONNX)
 ONNX_SOURCES = {
     "text": {
-        "url": "https://huggingface.co/optimum/all-MiniLM-L6-v2-onnx/resolve/main/model.onnx",
+        "url": "https://huggingface.co/Xenova/all-MiniLM-L6-v2/resolve/main/onnx/model_quantized.onnx",
+        "fp32_url": "https://huggingface.co/optimum/all-MiniLM-L6-v2-onnx/resolve/main/model.onnx",
         "vocab_url": "https://huggingface.co/sentence-transformers/all-MiniLM-L6-v2/resolve/main/vocab.txt",
     },
     "image": {
         "url": "https://huggingface.co/laion/CLIP-ViT-B-32-laion2B-s34B-b79K/resolve/main/visual.onnx",
+        # Reduced-precision exports of the same ViT-B/32 architecture, but with OpenAI
+        # weights: embeddings are not comparable with the LAION fp32 model's
+        "fp16": "https://huggingface.co/Xenova/clip-vit-base-patch32/resolve/main/onnx/vision_model_fp16.onnx",
+        "int8": "https://huggingface.co/Xenova/clip-vit-base-patch32/resolve/main/onnx/vision_model_quantized.onnx",
     }
 }
 
 
+# Hosts the downloads hit (LFS files redirect to the CDN)
+DOWNLOAD_HOSTS = ("huggingface.co", "cdn-lfs.huggingface.co")
+
+
+def prewarm_dns(hosts=DOWNLOAD_HOSTS) -> None:
+    """Resolve download hosts in a background thread so lookups overlap startup."""
+    import socket
+    
+    def resolve():
+        for host in hosts:
+            try:
+                socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+            except OSError:
+                pass  # The real request reports resolution errors
+    
+    threading.Thread(target=resolve, name="dns-prewarm", daemon=True).start()
+
+
 def get_cache_dir() -> Path:
     """Get the default cache directory for models."""
     if os.name == 'nt':  # Windows
@@ -61,51 +100,372 @@ def get_cache_dir() -> Path:
     return cache_base / 'vector_studio' / 'models'
 
 
-def download_file(url: str, dest: Path, chunk_size: int = 8192) -> bool:
-    """Download a file from URL with progress indication."""
+# Download settings
+DOWNLOAD_SEGMENTS = 8                   # Concurrent Range requests per file
+MIN_SEGMENT_SIZE = 4 * 1024 * 1024      # Don't split files smaller than this per segment
+COPY_BUFFER_SIZE = 1024 * 1024          # Read/write size for copying response bodies
+DOWNLOAD_ATTEMPTS = 2                   # Tries before giving up on a checksum mismatch
+PROGRESS_INTERVAL = 0.25                # Seconds between progress line updates
+LINE_PROGRESS_STEP = 10                 # Percent between lines when downloads run concurrently
+
+
+class _Progress:
+    """Thread-safe byte counter that redraws the progress line at most every PROGRESS_INTERVAL.
+    
+    All instances write through one lock. With ``line_mode`` set (several files
+    downloading at once), each file prints a full line per LINE_PROGRESS_STEP percent
+    instead of redrawing a shared ``\r`` line that the other downloads would overwrite.
+    """
+    
+    line_mode = False
+    _output_lock = threading.Lock()
+    
+    def __init__(self, label: str, total_size: int):
+        self.label = label
+        self.total_size = total_size
+        self.downloaded = 0
+        self._last_render = 0.0
+        self._last_step = -1
+        self._lock = threading.Lock()
+    
+    def update(self, nbytes: int):
+        with self._lock:
+            self.downloaded += nbytes
+            if self.line_mode:
+                self._render_line()
+                return
+            now = time.monotonic()
+            if now - self._last_render >= PROGRESS_INTERVAL:
+                self._last_render = now
+                self._render()
+    
+    def finish(self):
+        with self._lock:
+            if self.line_mode:
+                # Unknown sizes get no percentage lines, so report the total once here
+                if self._last_step * LINE_PROGRESS_STEP < 100:
+                    self._write("  %s: done (%d bytes)\n" % (self.label, self.downloaded))
+                return
+            self._render()
+        self._write("\n")
+    
+    def _render(self):
+        if self.total_size > 0:
+            percent = (self.downloaded / self.total_size) * 100
+            self._write("\r  %s: %.1f%% (%d/%d)" % (
+                self.label, percent, self.downloaded, self.total_size))
+    
+    def _render_line(self):
+        if self.total_size > 0:
+            step = self.downloaded * 100 // self.total_size // LINE_PROGRESS_STEP
+            if step > self._last_step:
+                self._last_step = step
+                self._write("  %s: %d%% (%d/%d)\n" % (
+                    self.label, step * LINE_PROGRESS_STEP, self.downloaded, self.total_size))
+    
+    @classmethod
+    def _write(cls, text: str):
+        with cls._output_lock:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+
+
+class _ProgressReader:
+    """File-like wrapper that reports bytes read so copyfileobj can drive progress.
+    
+    ``nbytes`` counts what was actually received, since a dropped connection just
+    ends the stream early instead of raising.
+    """
+    
+    def __init__(self, raw, progress: _Progress):
+        self._raw = raw
+        self._progress = progress
+        self.nbytes = 0
+    
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._raw.read(size)
+        if chunk:
+            self.nbytes += len(chunk)
+            self._progress.update(len(chunk))
+        return chunk
+
+
+def _linked_sha256(headers) -> Optional[str]:
+    """Return the SHA-256 the Hub publishes for an LFS file (X-Linked-Etag), if any."""
+    linked = (headers.get('x-linked-etag') or '').strip('"').lower()
+    return linked if re.fullmatch(r'[0-9a-f]{64}', linked) else None
+
+
+def _probe_download(url: str) -> tuple:
+    """HEAD the URL and return (final_url, size, etag, accepts_ranges, sha256).
+    
+    ``sha256`` is the digest from the Hub's X-Linked-Etag header, which is only sent
+    on the resolve URL's redirect to the CDN, so it is read off the redirect response.
+    """
+    import urllib.request
+    
+    class RecordingRedirectHandler(urllib.request.HTTPRedirectHandler):
+        sha256 = None
+        
+        def redirect_request(self, req, fp, code, msg, headers, newurl):
+            self.sha256 = self.sha256 or _linked_sha256(headers)
+            return super().redirect_request(req, fp, code, msg, headers, newurl)
+    
+    redirects = RecordingRedirectHandler()
+    request = urllib.request.Request(url, method='HEAD')
+    with urllib.request.build_opener(redirects).open(request) as response:
+        size = int(response.headers.get('content-length', 0))
+        etag = response.headers.get('etag')
+        accepts_ranges = response.headers.get('accept-ranges', '').lower() == 'bytes'
+        sha256 = redirects.sha256 or _linked_sha256(response.headers)
+        # Reuse the post-redirect URL so segments don't each follow the redirect
+        return response.geturl(), size, etag, accepts_ranges, sha256
+
+
+def sha256_file(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file, hashed through an mmap'd view (no read() copies)."""
+    import hashlib
+    import mmap
+    
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size:  # Empty files can't be mapped
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                digest.update(mm)
+    return digest.hexdigest()
+
+
+def _download_segment(url: str, dest: Path, start: int, end: int,
+                      etag: Optional[str], progress: _Progress, chunk_size: int) -> None:
+    """Download bytes [start, end] of url into the same offsets of dest."""
+    import shutil
+    import urllib.request
+    
+    headers = {'Range': f'bytes={start}-{end}'}
+    # If-Range needs a strong validator; the server then sends 200 if the file changed
+    if _strong_etag(etag):
+        headers['If-Range'] = etag
+    
+    request = urllib.request.Request(url, headers=headers)
+    with urllib.request.urlopen(request) as response:
+        if response.status != 206:
+            raise RuntimeError(f"expected 206 Partial Content, got {response.status}")
+        
+        reader = _ProgressReader(response, progress)
+        with open(dest, 'r+b') as f:
+            f.seek(start)
+            shutil.copyfileobj(reader, f, chunk_size)
+    
+    # A short segment would leave a zero-filled hole in the preallocated file
+    expected = end - start + 1
+    if reader.nbytes != expected:
+        raise RuntimeError(f"segment {start}-{end} truncated: got {reader.nbytes} of {expected} bytes")
+
+
+def _download_parallel(url: str, dest: Path, total_size: int, etag: Optional[str],
+                       chunk_size: int) -> None:
+    """Download a file as concurrent Range segments into a preallocated file."""
+    from concurrent.futures import ThreadPoolExecutor
+    
+    segments = max(1, min(DOWNLOAD_SEGMENTS, total_size // MIN_SEGMENT_SIZE))
+    segment_size = -(-total_size // segments)  # ceil division
+    ranges = [
+        (start, min(start + segment_size, total_size) - 1)
+        for start in range(0, total_size, segment_size)
+    ]
+    
+    with open(dest, 'wb') as f:
+        f.truncate(total_size)
+    
+    print(f"  Using {len(ranges)} parallel segments")
+    progress = _Progress(dest.name, total_size)
+    with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+        futures = [
+            executor.submit(_download_segment, url, dest, start, end, etag, progress, chunk_size)
+            for start, end in ranges
+        ]
+        for future in futures:
+            future.result()
+    progress.finish()
+
+
+def _strong_etag(etag: Optional[str]) -> Optional[str]:
+    """Return etag if it is a strong validator (usable with If-Range), else None."""
+    return etag if etag and not etag.startswith('W/') else None
+
+
+def _etag_path(dest: Path) -> Path:
+    """Sidecar holding the ETag of the file a partial dest belongs to."""
+    return dest.with_name(dest.name + '.etag')
+
+
+def _download_single(url: str, dest: Path, chunk_size: int, resume_from: int = 0,
+                     etag: Optional[str] = None) -> None:
+    """Download a file as a single stream.
+    
+    With ``resume_from`` set, asks for the remaining bytes with ``If-Range: etag`` and
+    appends them to dest. If the remote file changed (or the server ignores Range) the
+    reply is the whole file, which replaces dest. A fresh download records the
+    response's strong ETag next to dest so an interrupted run can be resumed.
+    """
+    import shutil
+    import urllib.error
     import urllib.request
     
+    headers = {}
+    if resume_from:
+        headers = {'Range': f'bytes={resume_from}-', 'If-Range': etag}
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        response = urllib.request.urlopen(request)
+    except urllib.error.HTTPError as e:
+        if e.code != 416 or not resume_from:
+            raise
+        # Range not satisfiable: either dest already holds the whole file, or it
+        # doesn't fit the remote one at all
+        match = re.fullmatch(r'bytes \*/(\d+)', e.headers.get('content-range', ''))
+        if match and int(match.group(1)) == resume_from:
+            print("  Partial file is already complete")
+            return
+        print("  Partial file is stale, restarting download")
+        return _download_single(url, dest, chunk_size)
+    
+    with response:
+        length = int(response.headers.get('content-length', 0))
+        if resume_from and response.status == 206:
+            # The server must continue exactly where dest ends, or the file is spliced
+            match = re.match(r'bytes (\d+)-', response.headers.get('content-range', ''))
+            if not match or int(match.group(1)) != resume_from:
+                response.close()
+                print("  Server resumed at the wrong offset, restarting download")
+                return _download_single(url, dest, chunk_size)
+            mode = 'ab'
+            total_size = resume_from + length if length else 0
+        else:
+            if resume_from:
+                print("  Remote file changed, restarting download")
+            mode = 'wb'
+            resume_from = 0
+            total_size = length
+            # Saved before any data, so an interruption always leaves a validator
+            new_etag = _strong_etag(response.headers.get('etag'))
+            if new_etag:
+                _etag_path(dest).write_text(new_etag, encoding='utf-8')
+            else:
+                _etag_path(dest).unlink(missing_ok=True)
+        
+        progress = _Progress(dest.name, total_size)
+        progress.downloaded = resume_from
+        reader = _ProgressReader(response, progress)
+        with open(dest, mode) as f:
+            shutil.copyfileobj(reader, f, chunk_size)
+        progress.finish()
+    
+    # Without Content-Length there is nothing to check against
+    if length and reader.nbytes != length:
+        raise RuntimeError(f"download truncated: got {reader.nbytes} of {length} bytes")
+
+
+def _download_to(url: str, dest: Path, chunk_size: int, probe: tuple) -> None:
+    """Download url into dest, in parallel when possible.
+    
+    dest only ever holds a contiguous prefix of the file, so a leftover dest from an
+    interrupted run is resumed, provided the ETag saved with it is strong; without
+    one a changed remote file can't be detected, so it is downloaded again. Parallel
+    segments are assembled in a separate ``.segments`` file, which has holes until
+    complete and so is never resumed. ``probe`` is the result of _probe_download.
+    """
+    resume_from = dest.stat().st_size if dest.exists() else 0
+    if resume_from:
+        etag_path = _etag_path(dest)
+        etag = _strong_etag(etag_path.read_text(encoding='utf-8').strip()) if etag_path.exists() else None
+        if etag:
+            print(f"  Resuming partial download at byte {resume_from}")
+            _download_single(url, dest, chunk_size, resume_from, etag)
+            return
+        print("  Partial download has no ETag to validate it, starting over")
+        dest.unlink()
+    
+    final_url, total_size, etag, accepts_ranges, _ = probe
+    if accepts_ranges and total_size >= 2 * MIN_SEGMENT_SIZE:
+        segments_path = dest.with_name(dest.name + '.segments')
+        try:
+            _download_parallel(final_url, segments_path, total_size, etag, chunk_size)
+            os.replace(segments_path, dest)
+            return
+        except Exception as e:
+            segments_path.unlink(missing_ok=True)
+            print(f"\n  Parallel download failed ({e}), retrying as a single stream")
+    
+    _download_single(url, dest, chunk_size)
+
+
+def download_file(url: str, dest: Path, chunk_size: int = COPY_BUFFER_SIZE) -> bool:
+    """Download a file from URL with progress indication.
+    
+    Uses parallel HTTP Range requests when the server supports them and the file is
+    large enough, otherwise falls back to a single stream. Data is staged in
+    ``<dest>.part`` and only moved into place (atomically) once complete, so an
+    interrupted run never leaves a truncated model at ``dest``. A ``.part`` left by
+    an interrupted run is resumed with ``Range: bytes=N-`` guarded by ``If-Range``.
+    
+    Before the rename the ``.part`` is checked against the SHA-256 the Hub publishes
+    for the file (X-Linked-Etag); on a mismatch it is deleted and downloaded again,
+    up to DOWNLOAD_ATTEMPTS times. Files without a published digest (non-LFS files
+    such as vocab.txt) are only checked for completeness.
+    """
     print(f"  Downloading: {url}")
     print(f"  Destination: {dest}")
     
     dest.parent.mkdir(parents=True, exist_ok=True)
+    part_path = dest.with_name(dest.name + '.part')
     
     try:
-        with urllib.request.urlopen(url) as response:
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
-            
-            with open(dest, 'wb') as f:
-                while True:
-                    chunk = response.read(chunk_size)
-                    if not chunk:
-                        break
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    
-                    if total_size > 0:
-                        progress = (downloaded / total_size) * 100
-                        print(f"\r  Progress: {progress:.1f}% ({downloaded}/{total_size})", end='', flush=True)
-            
-            print()  # Newline after progress
-            return True
-            
-    except Exception as e:
-        print(f"\n  Error downloading: {e}")
-        return False
+        probe = _probe_download(url)
+    except Exception:
+        probe = (url, 0, None, False, None)
+    expected_sha256 = probe[4]
+    
+    for attempt in range(1, DOWNLOAD_ATTEMPTS + 1):
+        try:
+            _download_to(url, part_path, chunk_size, probe)
+        except Exception as e:
+            print(f"\n  Error downloading: {e}")
+            if part_path.exists():
+                print(f"  Partial download kept for resume: {part_path}")
+            return False
+        
+        if expected_sha256 is not None:
+            digest = sha256_file(part_path)
+            if digest != expected_sha256:
+                print(f"  Checksum mismatch (attempt {attempt}/{DOWNLOAD_ATTEMPTS}): "
+                      f"expected {expected_sha256}, got {digest}")
+                part_path.unlink()
+                _etag_path(part_path).unlink(missing_ok=True)
+                continue
+            print(f"  SHA-256 verified: {digest}")
+        
+        # Atomic on POSIX and Windows: readers never see a half-written model
+        os.replace(part_path, dest)
+        _etag_path(part_path).unlink(missing_ok=True)
+        return True
+    
+    return False
 
 
-def download_with_hf(repo_id: str, filename: str, dest_dir: Path) -> Optional[Path]:
-    """Download a file using HuggingFace Hub."""
+def download_snapshot_with_hf(repo_id: str, allow_patterns: list, dest_dir: Path) -> Optional[Path]:
+    """Download the files of a HuggingFace repo matching allow_patterns in one parallel batch."""
     if not HAS_HF:
         return None
     
+    from huggingface_hub import snapshot_download
+    
     try:
-        path = hf_hub_download(
+        path = snapshot_download(
             repo_id=repo_id,
-            filename=filename,
             local_dir=dest_dir,
-            local_dir_use_symlinks=False
+            allow_patterns=allow_patterns,
+            max_workers=HF_MAX_WORKERS
         )
         return Path(path)
     except Exception as e:
@@ -113,18 +473,22 @@ def download_with_hf(repo_id: str, filename: str, dest_dir: Path) -> Optional[Pa
         return None
 
 
-def download_text_model(dest_dir: Path, force: bool = False) -> bool:
-    """Download the text embedding model."""
+def download_text_model(dest_dir: Path, force: bool = False, fp32: bool = False) -> bool:
+    """Download the text embedding model (int8-quantized unless fp32 is set)."""
     print("\n" + "=" * 60)
-    print("Downloading Text Encoder (all-MiniLM-L6-v2)")
+    print(f"Downloading Text Encoder (all-MiniLM-L6-v2, {'fp32' if fp32 else 'int8'})")
     print("=" * 60)
     
+    config = MODELS["text"]
+    onnx_file = config["fp32_onnx_file"] if fp32 else config["onnx_file"]
+    url = ONNX_SOURCES["text"]["fp32_url"] if fp32 else ONNX_SOURCES["text"]["url"]
+    
     model_dir = dest_dir / "text"
-    model_path = model_dir / "model.onnx"
+    model_path = model_dir / onnx_file
     vocab_path = model_dir / "vocab.txt"
     
-    if model_path.exists() and vocab_path.exists() and not force:
-        print(f"  ✓ Model already exists at {model_dir}")
+    if not force and vocab_path.exists() and model_path.exists():
+        print(f"  ✓ Cache hit: model already exists at {model_dir}")
         return True
     
     model_dir.mkdir(parents=True, exist_ok=True)
@@ -134,35 +498,36 @@ def download_text_model(dest_dir: Path, force: bool = False) -> bool:
     
     if HAS_HF:
         print("  Trying HuggingFace Hub...")
-        # Download ONNX model
-        hf_path = download_with_hf(
-            "optimum/all-MiniLM-L6-v2-onnx", 
-            "model.onnx",
+        # ONNX model and tokenizer assets in a single parallel snapshot
+        download_snapshot_with_hf(
+            "Xenova/all-MiniLM-L6-v2",
+            [f"onnx/{onnx_file}", "tokenizer*", "vocab.txt", "special_tokens_map.json"],
             model_dir
         )
         
-        if hf_path:
-            if hf_path != model_path:
-                import shutil
-                shutil.move(str(hf_path), str(model_path))
+        # The repo keeps its ONNX exports under onnx/
+        hf_model_path = model_dir / "onnx" / onnx_file
+        if hf_model_path.exists():
+            os.replace(hf_model_path, model_path)
+            try:
+                hf_model_path.parent.rmdir()
+            except OSError:
+                pass
+        
+        if model_path.exists():
             print(f"  ✓ ONNX model downloaded")
         else:
-            success = download_file(ONNX_SOURCES["text"]["url"], model_path)
+            success = download_file(url, model_path)
         
-        # Download vocab
-        try:
-            tokenizer = AutoTokenizer.from_pretrained(
-                "sentence-transformers/all-MiniLM-L6-v2"
-            )
-            tokenizer.save_pretrained(str(model_dir))
+        if vocab_path.exists():
             print(f"  ✓ Tokenizer downloaded")
-        except Exception as e:
-            print(f"  Warning: Tokenizer download failed: {e}")
-            success = download_file(ONNX_SOURCES["text"]["vocab_url"], vocab_path)
+        else:
+            print("  Warning: Tokenizer not in snapshot, downloading vocab directly")
+            success = download_file(ONNX_SOURCES["text"]["vocab_url"], vocab_path) and success
     else:
         # Fallback to direct download
         print("  Using direct download (huggingface_hub not installed)")
-        success = download_file(ONNX_SOURCES["text"]["url"], model_path)
+        success = download_file(url, model_path)
         success = success and download_file(ONNX_SOURCES["text"]["vocab_url"], vocab_path)
     
     if success:
@@ -173,23 +538,31 @@ def download_text_model(dest_dir: Path, force: bool = False) -> bool:
     return success
 
 
-def download_image_model(dest_dir: Path, force: bool = False) -> bool:
-    """Download the image embedding model (CLIP)."""
+def download_image_model(dest_dir: Path, force: bool = False, precision: str = "fp32") -> bool:
+    """Download the image embedding model (CLIP) at the given precision."""
     print("\n" + "=" * 60)
-    print("Downloading Image Encoder (CLIP ViT-B/32)")
+    print(f"Downloading Image Encoder (CLIP ViT-B/32, {precision})")
     print("=" * 60)
     
+    config = MODELS["image"]
+    url = ONNX_SOURCES["image"]["url" if precision == "fp32" else precision]
+    
     model_dir = dest_dir / "image"
-    model_path = model_dir / "visual.onnx"
+    model_path = model_dir / config["precision_files"][precision]
+    
+    if precision != "fp32":
+        print(f"  Warning: the {precision} encoder uses OpenAI CLIP weights, not LAION.")
+        print("           Its embeddings are incompatible with indexes built with the")
+        print("           default fp32 model; re-embed existing images if you switch.")
     
-    if model_path.exists() and not force:
-        print(f"  ✓ Model already exists at {model_dir}")
+    if not force and model_path.exists():
+        print(f"  ✓ Cache hit: model already exists at {model_path}")
         return True
     
     model_dir.mkdir(parents=True, exist_ok=True)
     
     # Try direct download (CLIP ONNX models are less common on HF)
-    success = download_file(ONNX_SOURCES["image"]["url"], model_path)
+    success = download_file(url, model_path)
     
     if success:
         print(f"\n  ✓ Image model ready at: {model_dir}")
@@ -204,13 +577,18 @@ def download_image_model(dest_dir: Path, force: bool = False) -> bool:
 
 def verify_models(model_dir: Path) -> dict:
     """Verify downloaded models and return status."""
+    text_dir = model_dir / "text"
     status = {
         "text": {
-            "model": (model_dir / "text" / "model.onnx").exists(),
-            "vocab": (model_dir / "text" / "vocab.txt").exists(),
+            # Either the int8 default or the --fp32 variant counts
+            "model": any((text_dir / MODELS["text"][key]).exists()
+                         for key in ("onnx_file", "fp32_onnx_file")),
+            "vocab": (text_dir / "vocab.txt").exists(),
         },
         "image": {
-            "model": (model_dir / "image" / "visual.onnx").exists(),
+            # Any precision variant counts
+            "model": any((model_dir / "image" / name).exists()
+                         for name in MODELS["image"]["precision_files"].values()),
         }
     }
     return status
@@ -253,6 +631,8 @@ def main():
 Examples:
   %(prog)s --download           Download all models
   %(prog)s --download --text    Download text model only
+  %(prog)s --download --fp32    Use the full-precision text model
+  %(prog)s --download --precision int8   Use the int8 image model
   %(prog)s --status             Check model status
   %(prog)s --dir /path/to/models --download
         """
@@ -279,6 +659,18 @@ def main():
         action='store_true',
         help='Image model only'
     )
+    parser.add_argument(
+        '--fp32',
+        action='store_true',
+        help='Download the full-precision text model instead of the int8 one'
+    )
+    parser.add_argument(
+        '--precision',
+        choices=sorted(MODELS["image"]["precision_files"]),
+        default='fp32',
+        help='Image model precision (default: fp32, LAION weights; fp16/int8 are '
+             'OpenAI-weight exports with incompatible embeddings)'
+    )
     parser.add_argument(
         '--force', '-f',
         action='store_true',
@@ -292,6 +684,10 @@ def main():
     
     args = parser.parse_args()
     
+    if args.download:
+        # Overlap DNS lookups with the setup below
+        prewarm_dns()
+    
     # Determine model directory
     model_dir = args.dir if args.dir else get_cache_dir()
     model_dir = model_dir.resolve()
@@ -303,17 +699,28 @@ def main():
     
     if not HAS_HF:
         print("\nNote: huggingface_hub not installed. Using direct downloads.")
-        print("      Install with: pip install huggingface-hub transformers")
+        print("      Install with: pip install huggingface-hub hf-transfer")
     
     if args.download:
         download_both = not args.text and not args.image
+        want_text = args.text or download_both
+        want_image = args.image or download_both
         
-        success = True
-        if args.text or download_both:
-            success = download_text_model(model_dir, args.force) and success
-        
-        if args.image or download_both:
-            success = download_image_model(model_dir, args.force) and success
+        if want_text and want_image:
+            # The two models are independent network-bound downloads: run them side by side
+            from concurrent.futures import ThreadPoolExecutor
+            
+            # Two in-place \r progress lines on one terminal would garble each other
+            _Progress.line_mode = True
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                text_future = executor.submit(download_text_model, model_dir, args.force, args.fp32)
+                image_future = executor.submit(download_image_model, model_dir, args.force, args.precision)
+                results = [text_future.result(), image_future.result()]
+            success = all(results)
+        elif want_text:
+            success = download_text_model(model_dir, args.force, args.fp32)
+        else:
+            success = download_image_model(model_dir, args.force, args.precision)
         
         print_status(model_dir)
         sys.exit(0 if success else 1)
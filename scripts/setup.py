@@ -6,14 +6,24 @@
 """
 
 import argparse
+import atexit
+import hashlib
+import json
 import os
 import platform
 import shutil
 import subprocess
 import sys
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
+# Shared worker pool for the parallel parts of setup; threads are started on demand
+# and reused across calls instead of building a new executor each time
+_POOL = ThreadPoolExecutor(max_workers=max(8, os.cpu_count() or 1))
+atexit.register(_POOL.shutdown, wait=False)
+
 
 class Colors:
     """ANSI color codes for terminal output."""
@@ -32,9 +42,8 @@ def disable():
 
 def print_header(text: str):
     """Print a formatted header."""
-    print(f"\n{Colors.BOLD}{Colors.BLUE}{'=' * 60}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{text}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{'=' * 60}{Colors.END}")
+    rule = f"{Colors.BOLD}{Colors.BLUE}{'=' * 60}{Colors.END}"
+    sys.stdout.write(f"\n{rule}\n{Colors.BOLD}{Colors.BLUE}{text}{Colors.END}\n{rule}\n")
 
 
 def print_success(text: str):
@@ -96,14 +105,22 @@ def refresh_path_windows():
 
 
 def run_command(cmd: List[str], cwd: Optional[Path] = None, 
-                capture: bool = False) -> subprocess.CompletedProcess:
-    """Run a command with error handling."""
+                capture: bool = False, env: Optional[dict] = None) -> subprocess.CompletedProcess:
+    """Run a command with error handling.
+    
+    Without capture the child writes straight to our inherited stdout/stderr, so
+    build output never passes through Python.
+    """
     print_info(f"Running: {' '.join(cmd)}")
+    # Our stdout is block-buffered when piped (e.g. CI logs); flush so the banner
+    # lands before the child's output
+    sys.stdout.flush()
     
     try:
         result = subprocess.run(
             cmd,
             cwd=cwd,
+            env=env,
             capture_output=capture,
             text=True,
             check=True
@@ -116,8 +133,72 @@ def run_command(cmd: List[str], cwd: Optional[Path] = None,
         raise
 
 
-def check_requirements() -> dict:
-    """Check system requirements and return status."""
+def _probe_tool(argv: List[str]) -> Optional[str]:
+    """Run a version probe and return its stdout, or None if the tool is missing or fails."""
+    # Skip the process spawn entirely when the tool isn't on PATH
+    if shutil.which(argv[0]) is None:
+        return None
+    try:
+        result = subprocess.run(argv, capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+REQUIREMENTS_CACHE_TTL = 24 * 60 * 60  # seconds
+
+
+def get_requirements_cache_path() -> Path:
+    """Get the location of the cached requirements-check results."""
+    if os.name == 'nt':  # Windows
+        cache_base = Path(os.environ.get('LOCALAPPDATA', Path.home() / 'AppData' / 'Local'))
+    else:
+        cache_base = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache'))
+    
+    return cache_base / 'vector_studio' / 'req_cache.json'
+
+
+def _requirements_cache_key(probes: dict) -> str:
+    """Fingerprint PATH and the resolved probe binaries (location + mtime)."""
+    parts = [os.environ.get('PATH', '')]
+    for argv in probes.values():
+        # The full command line, so changing a probe's arguments invalidates the cache
+        parts.append(" ".join(argv))
+        tool = shutil.which(argv[0])
+        parts.append(f"{tool}:{os.path.getmtime(tool)}" if tool else f"{argv[0]}:missing")
+    return hashlib.sha1(";".join(parts).encode()).hexdigest()
+
+
+def _load_cached_requirements(key: str) -> Optional[dict]:
+    """Return cached probe outputs if they were recorded for this key in the last day."""
+    try:
+        cached = json.loads(get_requirements_cache_path().read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    if cached.get('key') != key or time.time() - cached.get('timestamp', 0) > REQUIREMENTS_CACHE_TTL:
+        return None
+    return cached.get('outputs')
+
+
+def _save_cached_requirements(key: str, outputs: dict):
+    cache_path = get_requirements_cache_path()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(
+            json.dumps({'key': key, 'timestamp': time.time(), 'outputs': outputs}),
+            encoding='utf-8'
+        )
+    except OSError:
+        pass  # Caching is best-effort
+
+
+def check_requirements(use_cache: bool = True, executor: Optional[Executor] = None) -> dict:
+    """Check system requirements and return status.
+    
+    Probe results are cached on disk and reused while PATH and the tool binaries
+    are unchanged; pass use_cache=False to force fresh probes. The probes run on
+    executor (default: the shared module pool).
+    """
     requirements = {
         'python': {'required': True, 'found': False, 'version': None},
         'cmake': {'required': True, 'found': False, 'version': None},
@@ -130,63 +211,61 @@ def check_requirements() -> dict:
     requirements['python']['found'] = True
     requirements['python']['version'] = platform.python_version()
     
-    # CMake
-    try:
-        result = subprocess.run(['cmake', '--version'], capture_output=True, text=True)
-        if result.returncode == 0:
-            requirements['cmake']['found'] = True
-            requirements['cmake']['version'] = result.stdout.split('\n')[0]
-    except FileNotFoundError:
-        pass
-    
-    # Compiler - Check for Visual Studio using vswhere
+    # The probes are independent, so run them all at once
+    probes = {
+        'cmake': ['cmake', '--version'],
+        'git': ['git', '--version'],
+        'ninja': ['ninja', '--version'],
+    }
     if platform.system() == 'Windows':
+        # Compiler - Check for Visual Studio using vswhere. "-products *" also
+        # matches Build Tools installs, which the default product filter skips
         vswhere = r"C:\Program Files (x86)\Microsoft Visual Studio\Installer\vswhere.exe"
-        if os.path.exists(vswhere):
-            try:
-                result = subprocess.run([vswhere, '-latest', '-property', 'displayName'], 
-                                       capture_output=True, text=True)
-                if result.returncode == 0 and result.stdout.strip():
-                    requirements['compiler']['found'] = True
-                    requirements['compiler']['name'] = result.stdout.strip()
-            except Exception:
-                pass
-        
-        # Also check Build Tools path
-        if not requirements['compiler']['found']:
-            bt_path = r"C:\Program Files (x86)\Microsoft Visual Studio\2022\BuildTools"
-            if os.path.exists(bt_path):
-                requirements['compiler']['found'] = True
-                requirements['compiler']['name'] = 'VS 2022 Build Tools'
+        # JSON carries displayName and installationPath from the one invocation
+        probes['vswhere'] = [vswhere, '-latest', '-products', '*', '-format', 'json']
     else:
         # Check for GCC/Clang on Unix
+        probes['g++'] = ['g++', '--version']
+        probes['clang++'] = ['clang++', '--version']
+    
+    cache_key = _requirements_cache_key(probes)
+    outputs = _load_cached_requirements(cache_key) if use_cache else None
+    if outputs is None:
+        executor = executor or _POOL
+        outputs = dict(zip(probes, executor.map(_probe_tool, probes.values()), strict=True))
+        _save_cached_requirements(cache_key, outputs)
+    
+    # CMake
+    if outputs['cmake'] is not None:
+        requirements['cmake']['found'] = True
+        requirements['cmake']['version'] = outputs['cmake'].split('\n')[0]
+    
+    # Compiler
+    if platform.system() == 'Windows':
+        try:
+            instances = json.loads(outputs['vswhere'] or '[]')
+        except ValueError:
+            instances = []
+        if instances:
+            requirements['compiler']['found'] = True
+            # Same name the old displayName probe reported; the path is only a fallback
+            requirements['compiler']['name'] = instances[0].get('displayName') or instances[0].get('installationPath')
+    else:
         for compiler in ['g++', 'clang++']:
-            try:
-                result = subprocess.run([compiler, '--version'], capture_output=True, text=True)
-                if result.returncode == 0:
-                    requirements['compiler']['found'] = True
-                    requirements['compiler']['name'] = compiler
-                    break
-            except FileNotFoundError:
-                continue
+            if outputs[compiler] is not None:
+                requirements['compiler']['found'] = True
+                requirements['compiler']['name'] = compiler
+                break
     
     # Git
-    try:
-        result = subprocess.run(['git', '--version'], capture_output=True, text=True)
-        if result.returncode == 0:
-            requirements['git']['found'] = True
-            requirements['git']['version'] = result.stdout.strip()
-    except FileNotFoundError:
-        pass
+    if outputs['git'] is not None:
+        requirements['git']['found'] = True
+        requirements['git']['version'] = outputs['git'].strip()
     
     # Ninja
-    try:
-        result = subprocess.run(['ninja', '--version'], capture_output=True, text=True)
-        if result.returncode == 0:
-            requirements['ninja']['found'] = True
-            requirements['ninja']['version'] = result.stdout.strip()
-    except FileNotFoundError:
-        pass
+    if outputs['ninja'] is not None:
+        requirements['ninja']['found'] = True
+        requirements['ninja']['version'] = outputs['ninja'].strip()
     
     return requirements
 
@@ -196,17 +275,20 @@ def print_requirements(requirements: dict) -> bool:
     print_header("System Requirements")
     
     all_met = True
+    lines = []
     for name, info in requirements.items():
         status = '✓' if info['found'] else '✗'
         color = Colors.GREEN if info['found'] else (Colors.RED if info['required'] else Colors.YELLOW)
         required = '(required)' if info['required'] else '(optional)'
         
         details = info.get('version') or info.get('name') or 'Not found'
-        print(f"  {color}{status}{Colors.END} {name}: {details} {required}")
+        lines.append(f"  {color}{status}{Colors.END} {name}: {details} {required}")
         
         if info['required'] and not info['found']:
             all_met = False
     
+    # One write for the whole table instead of one per row
+    sys.stdout.write("\n".join(lines) + "\n")
     return all_met
 
 
@@ -232,20 +314,45 @@ def setup_python_env(project_dir: Path, venv_name: str = 'venv'):
         pip_path = venv_dir / 'bin' / 'pip'
         python_path = venv_dir / 'bin' / 'python'
     
-    # Upgrade pip
-    print_info("Upgrading pip...")
-    run_command([str(python_path), '-m', 'pip', 'install', '--upgrade', 'pip'])
-    
-    # Install requirements
+    # Skip pip entirely when the venv was already installed from these exact requirements
     requirements_file = project_dir / 'requirements.txt'
+    hash_marker = venv_dir / '.req_hash'
+    req_hash = None
     if requirements_file.exists():
+        req_hash = hashlib.blake2b(requirements_file.read_bytes(), digest_size=16).hexdigest()
+        try:
+            if hash_marker.read_text(encoding='utf-8').strip() == req_hash:
+                print_success("Requirements unchanged since last install, skipping pip")
+                return venv_dir
+        except OSError:
+            pass
+    
+    # uv resolves and installs in parallel; it doesn't use the venv's pip at all
+    uv = shutil.which('uv')
+    if uv is None:
+        # Upgrade pip
+        print_info("Upgrading pip...")
+        run_command([str(python_path), '-m', 'pip', 'install', '--upgrade', 'pip'])
+    
+    # Install requirements
+    if req_hash is not None:
         print_info("Installing requirements...")
-        run_command([str(pip_path), 'install', '-r', str(requirements_file)])
+        if uv is not None:
+            run_command([uv, 'pip', 'install', '--python', str(python_path),
+                         '-r', str(requirements_file)])
+        else:
+            run_command([str(pip_path), 'install', '-r', str(requirements_file)])
+        hash_marker.write_text(req_hash, encoding='utf-8')
         print_success("Requirements installed")
     
     return venv_dir
 
 
+def find_compiler_launcher() -> Optional[str]:
+    """Find a compiler cache (sccache preferred, then ccache) on PATH."""
+    return shutil.which('sccache') or shutil.which('ccache')
+
+
 def configure_cmake(project_dir: Path, build_dir: Path, 
                    build_type: str = 'Release',
                    use_ninja: bool = True) -> bool:
@@ -267,9 +374,20 @@ def configure_cmake(project_dir: Path, build_dir: Path,
     # Use Ninja if available
     if use_ninja and shutil.which('ninja'):
         cmake_args.extend(['-G', 'Ninja'])
+        # Compile on every core but cap concurrent (memory-hungry, LTO) links
+        cmake_args.extend(['-DCMAKE_JOB_POOLS=link=2', '-DCMAKE_JOB_POOL_LINK=link'])
     elif platform.system() == 'Windows':
         cmake_args.extend(['-G', 'Visual Studio 17 2022', '-A', 'x64'])
     
+    # Reuse previously compiled objects across rebuilds
+    launcher = find_compiler_launcher()
+    if launcher:
+        print_info(f"Using compiler cache: {launcher}")
+        cmake_args.extend([
+            f'-DCMAKE_C_COMPILER_LAUNCHER={launcher}',
+            f'-DCMAKE_CXX_COMPILER_LAUNCHER={launcher}',
+        ])
+    
     try:
         run_command(cmake_args)
         print_success("CMake configuration complete")
@@ -279,20 +397,41 @@ def configure_cmake(project_dir: Path, build_dir: Path,
         return False
 
 
+def _uses_visual_studio_generator(build_dir: Path) -> bool:
+    """Check the configured generator recorded in CMakeCache.txt."""
+    try:
+        cache = (build_dir / 'CMakeCache.txt').read_text(encoding='utf-8', errors='ignore')
+    except OSError:
+        return False
+    return 'CMAKE_GENERATOR:INTERNAL=Visual Studio' in cache
+
+
 def build_project(build_dir: Path, parallel: int = None) -> bool:
     """Build the project using CMake."""
     print_header("Building Project")
     
-    cmake_args = ['cmake', '--build', str(build_dir), '--config', 'Release']
+    if not parallel:
+        parallel = os.cpu_count() or 4
     
-    if parallel:
-        cmake_args.extend(['--parallel', str(parallel)])
-    else:
-        cmake_args.extend(['--parallel'])
+    cmake_args = ['cmake', '--build', str(build_dir), '--config', 'Release',
+                  '--parallel', str(parallel)]
+    
+    if _uses_visual_studio_generator(build_dir):
+        # MSBuild: parallel projects plus parallel compilation within each project
+        cmake_args.extend(['--', f'/m:{parallel}', f'/p:CL_MPCount={parallel}'])
+    
+    # Sub-builds (e.g. ExternalProject) inherit the job count
+    env = {**os.environ, 'CMAKE_BUILD_PARALLEL_LEVEL': str(parallel)}
     
     try:
-        run_command(cmake_args)
+        run_command(cmake_args, env=env)
         print_success("Build complete")
+        
+        launcher = find_compiler_launcher()
+        if launcher:
+            print_info("Compiler cache statistics:")
+            sys.stdout.flush()
+            subprocess.run([launcher, '--show-stats'])
         return True
     except subprocess.CalledProcessError:
         print_error("Build failed")
@@ -427,8 +566,8 @@ def main():
         if not requirements['ninja']['found']:
             install_dependency_windows('Ninja-build.Ninja', 'Ninja')
         
-        # Re-check requirements
-        requirements = check_requirements()
+        # Re-check requirements (installs changed the environment, so skip the cache)
+        requirements = check_requirements(use_cache=False)
         all_met = print_requirements(requirements)
     
     if not all_met:
@@ -3,11 +3,13 @@
 import pytest
 from pathlib import Path
 
+ANALYSIS_PATH = Path(__file__).resolve().parent.parent / "docs" / "research" / "COMPETITOR_ANALYSIS.md"
+
 
 @pytest.fixture(scope="session")
 def analysis_path():
     """Get path to competitor analysis document."""
-    return Path(__file__).parent.parent / "docs" / "research" / "COMPETITOR_ANALYSIS.md"
+    return ANALYSIS_PATH
 
 
 @pytest.fixture(scope="session")
@@ -3,59 +3,208 @@
 Tests the complete API workflow including authentication, collections, documents, and search
 """
 
+import base64
+import json
+import os
 import pytest
 import requests
+import statistics
 import time
-from typing import Dict, Any
+import urllib3
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Any, Optional
 
 # Configuration
 API_BASE_URL = "http://localhost:8080"
 TEST_USERNAME = "admin"
 TEST_PASSWORD = "admin123"
 
+# Access tokens are reused across runs until shortly before they expire. They live
+# in pytest's own cache (.pytest_cache in the repo, gitignored), never a global
+# cache directory.
+TOKEN_CACHE_KEY = "hektor_tests/tokens"
+TOKEN_EXPIRY_MARGIN_SECONDS = 60
 
-class TestAPIIntegration:
-    """Integration tests for the Vector Studio API"""
+# Bare urllib3 pool for the trivial GETs, where requests' per-call overhead would
+# dominate the timing; JSON-heavy calls stay on the requests session
+HTTP_POOL = urllib3.PoolManager(num_pools=1, maxsize=32, headers={"Connection": "keep-alive"})
+
+
+def unique_suffix() -> str:
+    """Collection-name suffix that stays unique across concurrent xdist workers"""
+    return f"{int(time.time() * 1000)}_{os.getpid()}_{uuid.uuid4().hex[:6]}"
+
+
+# Documents loaded once into the shared read-only search collection
+SEARCH_DOCUMENTS = [
+    {"content": "Machine learning is a subset of AI"},
+    {"content": "Deep learning uses neural networks"},
+    {"content": "Natural language processing handles text"}
+]
+PERF_DOCUMENTS = [{"content": f"Test document {i}"} for i in range(100)]
+
+
+def _token_expiry(token: str) -> float:
+    """Read a JWT's exp claim without verifying it (the server does that)"""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return 0.0
+
+
+def _load_cached_token(cache, key: str) -> Optional[str]:
+    """Return the cached token for key if it has not (nearly) expired"""
+    if cache is None:
+        return None
+    tokens = cache.get(TOKEN_CACHE_KEY, {})
+    token = tokens.get(key) if isinstance(tokens, dict) else None
+    if token and _token_expiry(token) - time.time() > TOKEN_EXPIRY_MARGIN_SECONDS:
+        return token
+    return None
+
+
+def _save_cached_token(cache, key: str, token: str) -> None:
+    """Store token under key (caching is skipped when the cacheprovider plugin is disabled)"""
+    if cache is None:
+        return
+    tokens = cache.get(TOKEN_CACHE_KEY, {})
+    if not isinstance(tokens, dict):
+        tokens = {}
+    tokens[key] = token
+    cache.set(TOKEN_CACHE_KEY, tokens)
+
+
+def _wait_indexed(session: requests.Session, collection_name: str, expected_count: int,
+                  timeout: float = 2.0) -> bool:
+    """Poll a search probe until expected_count documents are searchable (or timeout)
+    
+    Probes share the per-IP search rate limit with the tests that follow, so the
+    poll backs off between probes and stops at the first 429 instead of spending
+    the rest of the bucket.
+    """
+    # The search endpoint caps k at 100
+    k = min(expected_count, 100)
+    delay = 0.05
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        probe = session.post(
+            f"{API_BASE_URL}/collections/{collection_name}/search",
+            json={"query": "test document", "k": k}
+        )
+        if probe.status_code == 429:
+            pytest.fail("Search rate limit hit while waiting for documents to be indexed")
+        if probe.ok and len(probe.json()) >= k:
+            return True
+        time.sleep(delay)
+        delay = min(delay * 2, 0.5)
+    return False
+
+
+@pytest.fixture(scope="module")
+def session() -> requests.Session:
+    """Shared keep-alive session so tests reuse connections to the API"""
+    s = requests.Session()
+    s.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=0))
+    s.headers.update({"Connection": "keep-alive"})
+    yield s
+    s.close()
+
+
+@pytest.fixture(scope="module")
+def auth_token(request: pytest.FixtureRequest, session: requests.Session) -> str:
+    """Get an access token (from pytest's cache, logging in only on a miss) and attach it to the session"""
+    cache = getattr(request.config, "cache", None)
+    key = f"{API_BASE_URL}|{TEST_USERNAME}"
+    token = _load_cached_token(cache, key)
+    if token is not None:
+        # A restarted server may have rotated its secret; one cheap call confirms the token
+        probe = session.get(
+            f"{API_BASE_URL}/collections",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        if not probe.ok:
+            token = None
     
-    @pytest.fixture(scope="class")
-    def auth_token(self) -> str:
-        """Get authentication token for tests"""
-        response = requests.post(
+    if token is None:
+        response = session.post(
             f"{API_BASE_URL}/auth/login",
             json={"username": TEST_USERNAME, "password": TEST_PASSWORD}
         )
         assert response.status_code == 200
         data = response.json()
         assert "access_token" in data
-        return data["access_token"]
+        token = data["access_token"]
+        _save_cached_token(cache, key, token)
+    
+    session.headers["Authorization"] = f"Bearer {token}"
+    return token
+
+
+@pytest.fixture(scope="module")
+def populated_collection(session: requests.Session, auth_token: str) -> str:
+    """Create and fill one collection for the read-only search tests"""
+    collection_name = f"test_search_{unique_suffix()}"
+    
+    response = session.post(
+        f"{API_BASE_URL}/collections",
+        json={"name": collection_name, "dimension": 384, "metric": "cosine"}
+    )
+    assert response.status_code == 200
     
-    @pytest.fixture
-    def headers(self, auth_token: str) -> Dict[str, str]:
-        """Get headers with authentication"""
-        return {
-            "Authorization": f"Bearer {auth_token}",
-            "Content-Type": "application/json"
-        }
+    # The two batches are independent once the collection exists, so send them together.
+    # requests.Session is not thread-safe; the urllib3 pool is.
+    headers = {
+        "Connection": "keep-alive",
+        "Authorization": f"Bearer {auth_token}",
+        "Content-Type": "application/json"
+    }
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(
+                HTTP_POOL.request,
+                "POST",
+                f"{API_BASE_URL}/collections/{collection_name}/documents/batch",
+                body=json.dumps({"documents": documents}),
+                headers=headers
+            )
+            for documents in (SEARCH_DOCUMENTS, PERF_DOCUMENTS)
+        ]
+        for future in futures:
+            assert future.result().status == 200
+    
+    # Poll until the documents are searchable instead of sleeping a fixed second
+    assert _wait_indexed(session, collection_name, len(SEARCH_DOCUMENTS) + len(PERF_DOCUMENTS)), \
+        "Documents were not searchable before the timeout"
+    
+    return collection_name
+
+
+class TestAPIIntegration:
+    """Integration tests for the Vector Studio API"""
     
     def test_health_check(self):
         """Test health endpoint"""
-        response = requests.get(f"{API_BASE_URL}/health")
-        assert response.status_code == 200
+        response = HTTP_POOL.request("GET", f"{API_BASE_URL}/health")
+        assert response.status == 200
         
-        data = response.json()
+        data = json.loads(response.data)
         assert data["status"] == "healthy"
         assert "version" in data
         assert "uptime_seconds" in data
     
     def test_metrics_endpoint(self):
         """Test Prometheus metrics endpoint"""
-        response = requests.get(f"{API_BASE_URL}/metrics")
-        assert response.status_code == 200
-        assert "vdb_api_requests_total" in response.text
+        response = HTTP_POOL.request("GET", f"{API_BASE_URL}/metrics")
+        assert response.status == 200
+        assert b"vdb_api_requests_total" in response.data
     
-    def test_login_success(self):
+    def test_login_success(self, session):
         """Test successful login"""
-        response = requests.post(
+        response = session.post(
             f"{API_BASE_URL}/auth/login",
             json={"username": TEST_USERNAME, "password": TEST_PASSWORD}
         )
@@ -65,26 +214,26 @@ def test_login_success(self):
         assert "access_token" in data
         assert data["token_type"] == "bearer"
     
-    def test_login_failure(self):
+    def test_login_failure(self, session):
         """Test login with invalid credentials"""
-        response = requests.post(
+        response = session.post(
             f"{API_BASE_URL}/auth/login",
             json={"username": "invalid", "password": "wrong"}
         )
         assert response.status_code == 401
     
-    def test_unauthorized_access(self):
+    def test_unauthorized_access(self, session):
         """Test accessing protected endpoint without token"""
-        response = requests.get(f"{API_BASE_URL}/collections")
+        # Drop the session's Authorization header for this request only
+        response = session.get(f"{API_BASE_URL}/collections", headers={"Authorization": None})
         assert response.status_code in [401, 403]
     
-    def test_create_collection(self, headers):
+    def test_create_collection(self, session, auth_token):
         """Test creating a new collection"""
-        collection_name = f"test_collection_{int(time.time())}"
+        collection_name = f"test_collection_{unique_suffix()}"
         
-        response = requests.post(
+        response = session.post(
             f"{API_BASE_URL}/collections",
-            headers=headers,
             json={
                 "name": collection_name,
                 "dimension": 384,
@@ -98,24 +247,20 @@ def test_create_collection(self, headers):
         assert data["dimension"] == 384
         assert data["metric"] == "cosine"
     
-    def test_list_collections(self, headers):
+    def test_list_collections(self, session, auth_token):
         """Test listing collections"""
-        response = requests.get(
-            f"{API_BASE_URL}/collections",
-            headers=headers
-        )
+        response = session.get(f"{API_BASE_URL}/collections")
         assert response.status_code == 200
         
         data = response.json()
         assert isinstance(data, list)
     
-    def test_add_document(self, headers):
+    def test_add_document(self, session, auth_token):
         """Test adding a document to a collection"""
         # First create a collection
-        collection_name = f"test_docs_{int(time.time())}"
-        create_response = requests.post(
+        collection_name = f"test_docs_{unique_suffix()}"
+        create_response = session.post(
             f"{API_BASE_URL}/collections",
-            headers=headers,
             json={
                 "name": collection_name,
                 "dimension": 384,
@@ -125,9 +270,8 @@ def test_add_document(self, headers):
         assert create_response.status_code == 200
         
         # Add a document
-        response = requests.post(
+        response = session.post(
             f"{API_BASE_URL}/collections/{collection_name}/documents",
-            headers=headers,
             json={
                 "content": "This is a test document about machine learning",
                 "metadata": {"source": "test", "category": "ml"}
@@ -139,21 +283,19 @@ def test_add_document(self, headers):
         assert "id" in data
         assert "message" in data
     
-    def test_add_documents_batch(self, headers):
+    def test_add_documents_batch(self, session, auth_token):
         """Test adding multiple documents in batch"""
-        collection_name = f"test_batch_{int(time.time())}"
+        collection_name = f"test_batch_{unique_suffix()}"
         
         # Create collection
-        requests.post(
+        session.post(
             f"{API_BASE_URL}/collections",
-            headers=headers,
             json={"name": collection_name, "dimension": 384, "metric": "cosine"}
         )
         
         # Add batch of documents
-        response = requests.post(
+        response = session.post(
             f"{API_BASE_URL}/collections/{collection_name}/documents/batch",
-            headers=headers,
             json={
                 "documents": [
                     {"content": "Document 1 about AI", "metadata": {"topic": "ai"}},
@@ -168,36 +310,45 @@ def test_add_documents_batch(self, headers):
         assert data["count"] == 3
         assert len(data["ids"]) == 3
     
-    def test_search(self, headers):
-        """Test semantic search"""
-        collection_name = f"test_search_{int(time.time())}"
+    def test_add_documents_batch_metadata_fields(self, session, auth_token):
+        """Test batch metadata that maps onto typed fields, mixed with extra keys and empty dicts"""
+        collection_name = f"test_batch_meta_{unique_suffix()}"
         
-        # Create collection and add documents
-        requests.post(
+        session.post(
             f"{API_BASE_URL}/collections",
-            headers=headers,
             json={"name": collection_name, "dimension": 384, "metric": "cosine"}
         )
         
-        requests.post(
+        response = session.post(
             f"{API_BASE_URL}/collections/{collection_name}/documents/batch",
-            headers=headers,
             json={
                 "documents": [
-                    {"content": "Machine learning is a subset of AI"},
-                    {"content": "Deep learning uses neural networks"},
-                    {"content": "Natural language processing handles text"}
+                    {
+                        "content": "Gold closed higher on a weaker dollar",
+                        "metadata": {
+                            "type": "journal",
+                            "date": "2025-01-02",
+                            "asset": "GOLD",
+                            "gold_price": 2650.5,
+                            "vix": None,
+                            "source": "test"
+                        }
+                    },
+                    {"content": "Document without metadata"},
+                    {"content": "Document with empty metadata", "metadata": {}}
                 ]
             }
         )
+        assert response.status_code == 200
         
-        # Wait a bit for indexing
-        time.sleep(1)
-        
-        # Perform search
-        response = requests.post(
-            f"{API_BASE_URL}/collections/{collection_name}/search",
-            headers=headers,
+        data = response.json()
+        assert data["count"] == 3
+        assert len(data["ids"]) == 3
+    
+    def test_search(self, session, populated_collection):
+        """Test semantic search"""
+        response = session.post(
+            f"{API_BASE_URL}/collections/{populated_collection}/search",
             json={
                 "query": "artificial intelligence and neural networks",
                 "k": 2
@@ -215,12 +366,9 @@ def test_search(self, headers):
             assert "score" in result
             assert "metadata" in result
     
-    def test_get_stats(self, headers):
+    def test_get_stats(self, session, auth_token):
         """Test getting database statistics"""
-        response = requests.get(
-            f"{API_BASE_URL}/stats",
-            headers=headers
-        )
+        response = session.get(f"{API_BASE_URL}/stats")
         assert response.status_code == 200
         
         data = response.json()
@@ -228,34 +376,30 @@ def test_get_stats(self, headers):
         assert "memory_usage_bytes" in data
         assert "collections" in data
     
-    def test_delete_collection(self, headers):
+    def test_delete_collection(self, session, auth_token):
         """Test deleting a collection"""
-        collection_name = f"test_delete_{int(time.time())}"
+        collection_name = f"test_delete_{unique_suffix()}"
         
         # Create collection
-        requests.post(
+        session.post(
             f"{API_BASE_URL}/collections",
-            headers=headers,
             json={"name": collection_name, "dimension": 384, "metric": "cosine"}
         )
         
         # Delete collection
-        response = requests.delete(
-            f"{API_BASE_URL}/collections/{collection_name}",
-            headers=headers
-        )
+        response = session.delete(f"{API_BASE_URL}/collections/{collection_name}")
         assert response.status_code == 200
     
-    def test_rate_limiting(self, headers):
+    def test_rate_limiting(self, auth_token):
         """Test rate limiting (if enabled)"""
-        # Make many requests quickly
-        responses = []
-        for _ in range(150):  # Exceed the default 100/minute limit
-            response = requests.get(
-                f"{API_BASE_URL}/health",
-                headers=headers
-            )
-            responses.append(response.status_code)
+        headers = {"Connection": "keep-alive", "Authorization": f"Bearer {auth_token}"}
+        # Fire the requests as one concurrent burst; the pool holds 32 connections
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            futures = [
+                executor.submit(HTTP_POOL.request, "GET", f"{API_BASE_URL}/health", headers=headers)
+                for _ in range(150)  # Exceed the default 100/minute limit
+            ]
+            responses = [future.result().status for future in futures]
         
         # Check if any requests were rate limited
         # Note: This might not trigger if rate limiting is disabled
@@ -263,20 +407,19 @@ def test_rate_limiting(self, headers):
         # Don't assert, just log
         print(f"Rate limiting triggered: {rate_limited}")
     
-    def test_cors_headers(self):
+    def test_cors_headers(self, session):
         """Test CORS headers are present"""
-        response = requests.options(
+        response = session.options(
             f"{API_BASE_URL}/health",
             headers={"Origin": "http://localhost:4200"}
         )
         # CORS headers should be present
         assert "access-control-allow-origin" in response.headers or response.status_code == 200
     
-    def test_invalid_collection_name(self, headers):
+    def test_invalid_collection_name(self, session, auth_token):
         """Test creating collection with invalid name"""
-        response = requests.post(
+        response = session.post(
             f"{API_BASE_URL}/collections",
-            headers=headers,
             json={
                 "name": "",  # Empty name
                 "dimension": 384,
@@ -285,11 +428,10 @@ def test_invalid_collection_name(self, headers):
         )
         assert response.status_code in [400, 422]  # Validation error
     
-    def test_invalid_metric(self, headers):
+    def test_invalid_metric(self, session, auth_token):
         """Test creating collection with invalid metric"""
-        response = requests.post(
+        response = session.post(
             f"{API_BASE_URL}/collections",
-            headers=headers,
             json={
                 "name": "test",
                 "dimension": 384,
@@ -302,58 +444,26 @@ def test_invalid_metric(self, headers):
 class TestAPIPerformance:
     """Performance tests for the API"""
     
-    @pytest.fixture(scope="class")
-    def auth_token(self) -> str:
-        """Get authentication token"""
-        response = requests.post(
-            f"{API_BASE_URL}/auth/login",
-            json={"username": TEST_USERNAME, "password": TEST_PASSWORD}
-        )
-        return response.json()["access_token"]
-    
-    @pytest.fixture
-    def headers(self, auth_token: str) -> Dict[str, str]:
-        """Get headers with authentication"""
-        return {
-            "Authorization": f"Bearer {auth_token}",
-            "Content-Type": "application/json"
-        }
-    
-    def test_search_latency(self, headers):
+    def test_search_latency(self, session, populated_collection):
         """Test search latency is acceptable"""
-        collection_name = f"perf_test_{int(time.time())}"
-        
-        # Setup
-        requests.post(
-            f"{API_BASE_URL}/collections",
-            headers=headers,
-            json={"name": collection_name, "dimension": 384, "metric": "cosine"}
-        )
-        
-        requests.post(
-            f"{API_BASE_URL}/collections/{collection_name}/documents/batch",
-            headers=headers,
-            json={
-                "documents": [
-                    {"content": f"Test document {i}"} for i in range(100)
-                ]
-            }
-        )
+        url = f"{API_BASE_URL}/collections/{populated_collection}/search"
         
-        time.sleep(1)  # Wait for indexing
+        # Warm up the server's query path so the first (cold) call doesn't skew timing
+        for _ in range(3):
+            session.post(url, json={"query": "warm", "k": 10})
         
         # Measure search latency
-        start = time.time()
-        response = requests.post(
-            f"{API_BASE_URL}/collections/{collection_name}/search",
-            headers=headers,
-            json={"query": "test document", "k": 10}
-        )
-        latency = time.time() - start
+        latencies = []
+        for _ in range(10):
+            start = time.perf_counter()
+            response = session.post(url, json={"query": "test document", "k": 10})
+            latencies.append(time.perf_counter() - start)
+            assert response.status_code == 200
         
-        assert response.status_code == 200
-        assert latency < 1.0  # Should be under 1 second
-        print(f"Search latency: {latency*1000:.2f}ms")
+        p50 = statistics.median(latencies)
+        p95 = statistics.quantiles(latencies, n=20)[-1]
+        assert p50 < 0.2  # Median should be under 200ms
+        print(f"Search latency: p50 {p50*1000:.2f}ms, p95 {p95*1000:.2f}ms")
 
 
 if __name__ == "__main__":
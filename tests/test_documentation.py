@@ -5,46 +5,66 @@
 
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DOCS_DIR = REPO_ROOT / "docs"
+README_PATH = REPO_ROOT / "README.md"
 
-def test_no_placeholder_urls():
+# Pattern to detect placeholder URLs
+PLACEHOLDER_URL_RE = re.compile(r'github\.com/yourusername|github\.com/YOUR[-_]?USERNAME', re.IGNORECASE)
+
+# Pattern to detect markdown links to other docs
+DOC_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+\.md[^)]*)\)')
+
+# Pattern to detect GitHub repository URLs
+REPO_URL_RE = re.compile(r'github\.com/([a-zA-Z0-9_-]+)/([a-zA-Z0-9_-]+)')
+
+# Pattern to detect placeholder owners in repository URLs
+PLACEHOLDER_REPO_RE = re.compile(r'YOUR_?USERNAME', re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def load_markdown_files():
     """
-    Ensure no placeholder URLs like 'yourusername' remain in documentation.
-    This is a regression protection test.
-    Allows YOUR_USERNAME in CONTRIBUTING.md as it's intentional for fork instructions.
+    Read README.md and every docs/**/*.md file once per session.
+    Returns (path, content) pairs shared by the URL and link checks below.
     """
-    docs_dir = Path(__file__).parent.parent / "docs"
-    readme = Path(__file__).parent.parent / "README.md"
-    
-    # Pattern to detect placeholder URLs
-    placeholder_pattern = re.compile(r'github\.com/yourusername|github\.com/YOUR[-_]?USERNAME', re.IGNORECASE)
-    
-    files_to_check = list(docs_dir.glob("**/*.md"))
-    if readme.exists():
-        files_to_check.append(readme)
+    # is_file() below also covers a missing README, so no separate exists()
+    files_to_check = list(DOCS_DIR.glob("**/*.md"))
+    files_to_check.append(README_PATH)
     
-    errors = []
+    loaded = []
     for file_path in files_to_check:
         if not file_path.is_file():
             continue
         
-        # Allow YOUR_USERNAME in CONTRIBUTING.md (for fork instructions)
-        if file_path.name in ["CONTRIBUTING.md", "24_CONTRIBUTING.md"]:
-            continue
-            
         try:
-            content = file_path.read_text(encoding='utf-8')
-            matches = list(placeholder_pattern.finditer(content))
-            
-            if matches:
-                for match in matches:
-                    # Get line number
-                    line_num = content[:match.start()].count('\n') + 1
-                    errors.append(f"{file_path.relative_to(file_path.parent.parent)}:{line_num} - Found placeholder URL: {match.group()}")
+            loaded.append((file_path, file_path.read_text(encoding='utf-8')))
         except Exception as e:
             print(f"Warning: Could not read {file_path}: {e}")
     
+    return tuple(loaded)
+
+
+def test_no_placeholder_urls():
+    """
+    Ensure no placeholder URLs like 'yourusername' remain in documentation.
+    This is a regression protection test.
+    Allows YOUR_USERNAME in CONTRIBUTING.md as it's intentional for fork instructions.
+    """
+    errors = []
+    for file_path, content in load_markdown_files():
+        # Allow YOUR_USERNAME in CONTRIBUTING.md (for fork instructions)
+        if file_path.name in ["CONTRIBUTING.md", "24_CONTRIBUTING.md"]:
+            continue
+        
+        for match in PLACEHOLDER_URL_RE.finditer(content):
+            # Get line number
+            line_num = content[:match.start()].count('\n') + 1
+            errors.append(f"{file_path.relative_to(file_path.parent.parent)}:{line_num} - Found placeholder URL: {match.group()}")
+    
     if errors:
         error_msg = "Found placeholder URLs in documentation:\n" + "\n".join(errors)
         error_msg += "\n\nPlease replace with actual repository URLs (e.g., github.com/amuzetnoM/hektor)"
@@ -57,30 +77,27 @@ def test_no_trailing_whitespace():
     This helps maintain clean diffs and prevents formatting issues.
     Only checks files likely to be frequently edited.
     """
-    docs_dir = Path(__file__).parent.parent / "docs"
-    readme = Path(__file__).parent.parent / "README.md"
-    
     # Focus on key files
     key_files = [
-        readme,
-        docs_dir / "01_INTRODUCTION.md",
-        docs_dir / "02_INSTALLATION.md",
-        docs_dir / "03_QUICKSTART.md",
-        docs_dir / "04_USER_GUIDE.md",
-        docs_dir / "24_CONTRIBUTING.md",
+        README_PATH,
+        DOCS_DIR / "01_INTRODUCTION.md",
+        DOCS_DIR / "02_INSTALLATION.md",
+        DOCS_DIR / "03_QUICKSTART.md",
+        DOCS_DIR / "04_USER_GUIDE.md",
+        DOCS_DIR / "24_CONTRIBUTING.md",
     ]
     
     errors = []
     for file_path in key_files:
-        if not file_path.exists() or not file_path.is_file():
+        if not file_path.is_file():
             continue
             
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    # Check for trailing whitespace (but allow empty lines)
-                    if line.rstrip('\n').endswith(' ') or line.rstrip('\n').endswith('\t'):
-                        errors.append(f"{file_path.name}:{line_num} - Trailing whitespace")
+            # Whitespace is ASCII, so scan raw bytes instead of decoding
+            for line_num, line in enumerate(file_path.read_bytes().splitlines(), 1):
+                # Check for trailing whitespace (but allow empty lines)
+                if line.endswith((b' ', b'\t')):
+                    errors.append(f"{file_path.name}:{line_num} - Trailing whitespace")
         except Exception as e:
             print(f"Warning: Could not read {file_path}: {e}")
     
@@ -97,38 +114,28 @@ def test_cross_references_valid():
     This helps catch broken links early.
     Note: This test is informational and won't fail the build for optional docs.
     """
-    docs_dir = Path(__file__).parent.parent / "docs"
-    
-    # Pattern to detect markdown links to other docs
-    link_pattern = re.compile(r'\[([^\]]+)\]\(([^)]+\.md[^)]*)\)')
-    
     warnings = []
-    for file_path in docs_dir.glob("*.md"):
-        if not file_path.is_file():
+    for file_path, content in load_markdown_files():
+        # Only top-level docs are checked; reuse the cached contents
+        if file_path.parent != DOCS_DIR:
             continue
+        
+        for link_text, link_path in DOC_LINK_RE.findall(content):
+            # Skip external links
+            if link_path.startswith('http'):
+                continue
             
-        try:
-            content = file_path.read_text(encoding='utf-8')
-            matches = link_pattern.findall(content)
+            # Remove anchors and query strings
+            clean_path = link_path.split('#')[0].split('?')[0]
             
-            for link_text, link_path in matches:
-                # Skip external links
-                if link_path.startswith('http'):
-                    continue
-                
-                # Remove anchors and query strings
-                clean_path = link_path.split('#')[0].split('?')[0]
-                
-                # Resolve the path relative to the file
-                if clean_path.startswith('/'):
-                    target_path = Path(__file__).parent.parent / clean_path.lstrip('/')
-                else:
-                    target_path = (file_path.parent / clean_path).resolve()
-                
-                if not target_path.exists():
-                    warnings.append(f"{file_path.name} -> Missing link target: {link_path}")
-        except Exception as e:
-            print(f"Warning: Could not read {file_path}: {e}")
+            # Resolve the path relative to the file
+            if clean_path.startswith('/'):
+                target_path = REPO_ROOT / clean_path.lstrip('/')
+            else:
+                target_path = (file_path.parent / clean_path).resolve()
+            
+            if not target_path.exists():
+                warnings.append(f"{file_path.name} -> Missing link target: {link_path}")
     
     # Just print warnings, don't fail
     if warnings:
@@ -146,39 +153,20 @@ def test_consistent_repository_urls():
     Catches mixed references to different repos.
     Allows YOUR_USERNAME in CONTRIBUTING.md for fork instructions.
     """
-    docs_dir = Path(__file__).parent.parent / "docs"
-    readme = Path(__file__).parent.parent / "README.md"
-    
-    # Pattern to detect GitHub repository URLs
-    repo_pattern = re.compile(r'github\.com/([a-zA-Z0-9_-]+)/([a-zA-Z0-9_-]+)')
-    
-    files_to_check = list(docs_dir.glob("**/*.md"))
-    if readme.exists():
-        files_to_check.append(readme)
-    
     found_repos = set()
     locations = {}
     
-    for file_path in files_to_check:
-        if not file_path.is_file():
-            continue
-        
+    for file_path, content in load_markdown_files():
         # Skip CONTRIBUTING.md for YOUR_USERNAME placeholders
         if file_path.name in ["CONTRIBUTING.md", "24_CONTRIBUTING.md"]:
             continue
-            
-        try:
-            content = file_path.read_text(encoding='utf-8')
-            matches = repo_pattern.findall(content)
-            
-            for owner, repo in matches:
-                repo_url = f"{owner}/{repo}"
-                found_repos.add(repo_url)
-                if repo_url not in locations:
-                    locations[repo_url] = []
-                locations[repo_url].append(file_path.name)
-        except Exception as e:
-            print(f"Warning: Could not read {file_path}: {e}")
+        
+        for owner, repo in REPO_URL_RE.findall(content):
+            repo_url = f"{owner}/{repo}"
+            found_repos.add(repo_url)
+            if repo_url not in locations:
+                locations[repo_url] = []
+            locations[repo_url].append(file_path.name)
     
     # Allow the main repository and common external references
     expected_repo = "amuzetnoM/hektor"
@@ -193,7 +181,7 @@ def test_consistent_repository_urls():
     }
     
     # Check for placeholder URLs only
-    placeholder_repos = {repo for repo in found_repos if "YOUR_USERNAME" in repo.upper() or "YOURUSERNAME" in repo.upper()}
+    placeholder_repos = {repo for repo in found_repos if PLACEHOLDER_REPO_RE.search(repo)}
     
     if placeholder_repos:
         error_msg = f"Found placeholder repository URLs:\n"